@@ -27,7 +27,7 @@
 # %%
 from math import prod
 
-input_02 = aoc_open_input("input_02.txt").splitlines()
+input_02 = aoc_load_input("input_02.txt").lines
 
 
 # %%
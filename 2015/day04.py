@@ -27,24 +27,11 @@
 # %%
 input_04 = "yzbqklnj"
 
-# %%
-import hashlib
-import pyperclip
-
 
+# %%
+@aoc_answer_display
 def solve(input_str: str, leading_zeros: int = 5) -> int:
-    max_iterations = (
-        10**6
-    )  # Set a maximum number of iterations to avoid infinite loops
-
-    for idx, _ in enumerate(range(1, max_iterations)):
-        key = f"{input_str}{idx}".encode("utf-8")
-        digest = hashlib.md5(key).hexdigest()
-        if digest.startswith(leading_zeros * "0"):
-            break
-
-    print(idx, input_str)
-    pyperclip.copy(idx)
+    idx, _ = next(aoc_md5_nonce_search(input_str, leading_zeros, start=1))
     return idx
 
 
@@ -30,7 +30,6 @@
 
 # %%
 import numpy as np
-import pyperclip
 
 # %%
 input_06 = aoc_open_input("input_06.txt")
@@ -42,6 +41,7 @@ def operation_map(bulb: bool, operation_instruct: str) -> bool:
     return instructions[operation_instruct]
 
 
+@aoc_answer_display
 def part_one(input_str: str) -> int:
     lights: dict[tuple[int, int], bool] = aoc_grid_dictionary(
         grid_size=1000, default_value=False
@@ -58,11 +58,11 @@ def part_one(input_str: str) -> int:
                     bulb=current_bulb, operation_instruct=operation
                 )
     result = sum(lights.values())
-    pyperclip.copy(result)
     return result
 
 
 # %%
+@aoc_answer_display
 def part_one_np(input_str: str) -> int:
     lights = np.full((1000, 1000), 0)
 
@@ -81,8 +81,6 @@ def part_one_np(input_str: str) -> int:
             )
 
     result = lights.sum()
-    pyperclip.copy(int(result))
-    print(result)
     return result
 
 
@@ -90,6 +88,94 @@ def part_one_np(input_str: str) -> int:
 part_one_np(input_06)
 
 
+# %%
+def parse_instructions(input_str: str) -> list[tuple[str, int, int, int, int]]:
+    """
+    Parse the instructions into ``(operation, start_x, start_y, end_x, end_y)``
+    tuples with exclusive ends.
+    """
+    instructions = []
+    for line in input_str.replace("turn ", "").splitlines():
+        operation, start, _, end = line.split()
+        start_x, start_y = map(int, start.split(","))
+        end_x, end_y = map(int, end.split(","))
+        instructions.append((operation, start_x, start_y, end_x + 1, end_y + 1))
+    return instructions
+
+
+def compressed_lights(
+    input_str: str, brightness: bool = False, difference_array: bool = True
+) -> int:
+    """
+    Follow the instructions on a coordinate-compressed grid.
+
+    The rectangle corners split the plane into at most O(n²) blocks for n
+    instructions, and every light inside a block always shares the same state,
+    so each block is updated once per instruction instead of once per light.
+    The size of the board therefore does not matter, only the number of
+    instructions does.
+
+    Parameters
+    ----------
+    input_str : str
+        The puzzle input.
+    brightness : bool, optional
+        Use the part two brightness rules instead of on/off/toggle, by default
+        False.
+    difference_array : bool, optional
+        When every operation only adds brightness (no ``turn off``), apply them
+        all at once with a 2D difference array and a double cumulative sum, by
+        default True.
+
+    Returns
+    -------
+    int
+        The number of lit lights, or the total brightness.
+    """
+    instructions = parse_instructions(input_str)
+
+    xs = np.unique([x for _, x0, _, x1, _ in instructions for x in (x0, x1)])
+    ys = np.unique([y for _, _, y0, _, y1 in instructions for y in (y0, y1)])
+    block_areas = np.outer(np.diff(xs), np.diff(ys))
+
+    operations, x0, y0, x1, y1 = zip(*instructions)
+    x0, x1 = np.searchsorted(xs, x0), np.searchsorted(xs, x1)
+    y0, y1 = np.searchsorted(ys, y0), np.searchsorted(ys, y1)
+
+    if brightness and difference_array and "off" not in operations:
+        amounts = np.where(np.array(operations) == "toggle", 2, 1)
+        difference = np.zeros((len(xs), len(ys)), dtype=np.int64)
+        np.add.at(difference, (x0, y0), amounts)
+        np.add.at(difference, (x1, y0), -amounts)
+        np.add.at(difference, (x0, y1), -amounts)
+        np.add.at(difference, (x1, y1), amounts)
+        blocks = difference.cumsum(axis=0).cumsum(axis=1)[:-1, :-1]
+        return int((blocks * block_areas).sum())
+
+    blocks = np.zeros(block_areas.shape, dtype=np.int64)
+    for operation, start_x, start_y, end_x, end_y in zip(operations, x0, y0, x1, y1):
+        block = blocks[start_x:end_x, start_y:end_y]
+        if brightness:
+            if operation == "on":
+                block += 1
+            elif operation == "off":
+                np.maximum(block - 1, 0, out=block)
+            elif operation == "toggle":
+                block += 2
+        elif operation == "on":
+            block[...] = 1
+        elif operation == "off":
+            block[...] = 0
+        elif operation == "toggle":
+            block ^= 1
+
+    return int((blocks * block_areas).sum())
+
+
+# %%
+compressed_lights(input_06)
+
+
 # %% [markdown]
 # ## --- Part Two ---
 #
@@ -119,6 +205,7 @@ part_one_np(input_06)
 
 
 # %%
+@aoc_answer_display
 def part_two_np(input_str: str) -> int:
     lights = np.full((1000, 1000), 0)
 
@@ -141,10 +228,11 @@ def part_two_np(input_str: str) -> int:
             )
 
     result = lights.sum()
-    pyperclip.copy(int(result))
-    print(result)
     return result
 
 
 # %%
 part_two_np(input_06)
+
+# %%
+compressed_lights(input_06, brightness=True)
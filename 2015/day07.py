@@ -97,18 +97,153 @@ input_07 = aoc_open_input("input_07.txt")
 # %%
 
 
+# %%
+from collections import defaultdict, deque
+
+MASK_16 = 0xFFFF
+OPCODES = {"SET": 0, "AND": 1, "OR": 2, "LSHIFT": 3, "RSHIFT": 4, "NOT": 5}
+
+
+class Circuit:
+    """
+    A wire circuit compiled once into an integer opcode table.
+
+    Every wire gets an integer id and is driven by exactly one gate
+    ``(opcode, left, right)``. Operands that are wires hold the wire id,
+    constants are stored as ``~value`` (always negative) so they can be told
+    apart without another lookup. The gates are topologically sorted so the
+    whole circuit is evaluated iteratively in a single pass, and overriding a
+    wire only re-evaluates the gates downstream of it.
+
+    Parameters
+    ----------
+    input_str : str
+        A string containing instructions for the circuit, one
+        ``expression -> wire`` per line.
+
+    Examples
+    --------
+    >>> circuit = Circuit("123 -> x\\nNOT x -> h")
+    >>> circuit["h"]
+    65412
+    >>> circuit.override("x", 0)
+    >>> circuit["h"]
+    65535
+    """
+
+    def __init__(self, input_str: str) -> None:
+        lines = [line.split(" -> ") for line in input_str.splitlines()]
+
+        self.wires = {wire: wire_id for wire_id, (_, wire) in enumerate(lines)}
+        self.gates = [self._compile(expression) for expression, _ in lines]
+        self.overrides: dict[int, int] = {}
+
+        self.dependents = defaultdict(list)
+        for wire_id, (_, left, right) in enumerate(self.gates):
+            for operand in {left, right}:
+                if operand >= 0:
+                    self.dependents[operand].append(wire_id)
+
+        self.order = self._topological_order()
+        self.position = {wire_id: i for i, wire_id in enumerate(self.order)}
+        self.values = [0] * len(self.gates)
+        self._evaluate(self.order)
+
+    def _operand(self, token: str) -> int:
+        return ~int(token) if token.isdigit() else self.wires[token]
+
+    def _compile(self, expression: str) -> tuple[int, int, int]:
+        tokens = expression.split()
+        if len(tokens) == 1:
+            return OPCODES["SET"], self._operand(tokens[0]), ~0
+        if len(tokens) == 2:
+            return OPCODES["NOT"], self._operand(tokens[1]), ~0
+        left, gate, right = tokens
+        return OPCODES[gate], self._operand(left), self._operand(right)
+
+    def _topological_order(self) -> list[int]:
+        pending = [
+            sum(operand >= 0 for operand in {left, right})
+            for _, left, right in self.gates
+        ]
+        ready = deque(wire_id for wire_id, count in enumerate(pending) if not count)
+        order = []
+        while ready:
+            wire_id = ready.popleft()
+            order.append(wire_id)
+            for dependent in self.dependents[wire_id]:
+                pending[dependent] -= 1
+                if not pending[dependent]:
+                    ready.append(dependent)
+
+        if len(order) != len(self.gates):
+            raise ValueError("The circuit contains a loop")
+        return order
+
+    def _evaluate(self, wire_ids: list[int]) -> None:
+        values = self.values
+        gates = self.gates
+        overrides = self.overrides
+
+        for wire_id in wire_ids:
+            if wire_id in overrides:
+                values[wire_id] = overrides[wire_id]
+                continue
+
+            opcode, left, right = gates[wire_id]
+            x = values[left] if left >= 0 else ~left
+            y = values[right] if right >= 0 else ~right
+
+            if opcode == 0:
+                values[wire_id] = x
+            elif opcode == 1:
+                values[wire_id] = x & y
+            elif opcode == 2:
+                values[wire_id] = x | y
+            elif opcode == 3:
+                values[wire_id] = (x << y) & MASK_16
+            elif opcode == 4:
+                values[wire_id] = x >> y
+            else:
+                values[wire_id] = ~x & MASK_16
+
+    def _downstream(self, wire_id: int) -> list[int]:
+        cone = {wire_id}
+        stack = [wire_id]
+        while stack:
+            for dependent in self.dependents[stack.pop()]:
+                if dependent not in cone:
+                    cone.add(dependent)
+                    stack.append(dependent)
+        return sorted(cone, key=self.position.__getitem__)
+
+    def override(self, wire: str, value: int | None) -> None:
+        """
+        Force ``wire`` to carry ``value`` (or restore its own gate when
+        ``value`` is None) and re-evaluate only the wires that depend on it.
+        """
+        wire_id = self.wires[wire]
+        if value is None:
+            self.overrides.pop(wire_id, None)
+        else:
+            self.overrides[wire_id] = value & MASK_16
+        self._evaluate(self._downstream(wire_id))
+
+    def __getitem__(self, wire: str) -> int:
+        return self.values[self.wires[wire]]
+
+    def signals(self) -> dict[str, int]:
+        return {wire: self.values[wire_id] for wire, wire_id in self.wires.items()}
+
+
 # %%
 def part_one_and_two(
-    input_str: str, wire: str, prior_instructions: dict | dict[str, int] = {}
+    input_str: str, wire: str, prior_instructions: dict[str, int] | None = None
 ) -> int:
     """
     Evaluate a circuit of logic gates and wires to determine the value of a
     specific wire.
 
-    This function simulates a circuit with logic gates and wires to calculate
-    the value of a specified wire. The circuit is represented by a series of
-    instructions provided in the input string.
-
     Parameters
     ----------
     input_str : str
@@ -117,69 +252,18 @@ def part_one_and_two(
         " -> ".
     wire : str
         The target wire for which the value needs to be calculated.
-    prior_instructions : dict | dict[str, int], optional
-        A dictionary containing prior instructions or values for variables in
-        the circuit. This is useful for memoization to avoid redundant
-        calculations. The default is an empty dictionary.
+    prior_instructions : dict[str, int] | None, optional
+        Wires whose signal is overridden with a fixed value, by default None.
 
     Returns
     -------
     int
         The calculated value of the specified wire in the circuit.
-
-    Notes
-    -----
-    The function uses a recursive approach to evaluate expressions involving
-    logic gates and wires. It supports basic logic gate operations such as AND,
-    OR, LSHIFT, RSHIFT, and NOT.
     """
-    original_instructions = {}
-
-    for line in input_str.splitlines():
-        expression, variable = line.split(" -> ")
-        original_instructions[variable] = expression
-
-    actual_instructions = prior_instructions or {}
-
-    def bitwise_not_int16(num: int) -> int:
-        return 2**16 + ~num if ~num < 0 else num
-
-    def get_value(key: str):
-        if key.isdigit():
-            return int(key)
-        if key in actual_instructions:
-            return actual_instructions[key]
-
-        value = original_instructions[key]
-
-        if value.isdigit():
-            actual_instructions[key] = int(value)
-            return actual_instructions[key]
-        if value.startswith("NOT"):
-            s1 = get_value(value[4:])
-            result = bitwise_not_int16(s1)
-            actual_instructions[value] = result
-            return actual_instructions[value]
-        if "OR" in value:
-            s1, s2 = value.split(" OR ")
-            actual_instructions[key] = get_value(s1) | get_value(s2)
-            return actual_instructions[key]
-        if "AND" in value:
-            s1, s2 = value.split(" AND ")
-            actual_instructions[key] = get_value(s1) & get_value(s2)
-            return actual_instructions[key]
-        if "LSHIFT" in value:
-            s1, digit = value.split(" LSHIFT ")
-            actual_instructions[key] = get_value(s1) << int(digit)
-            return actual_instructions[key]
-        if "RSHIFT" in value:
-            s1, digit = value.split(" RSHIFT ")
-            actual_instructions[key] = get_value(s1) >> int(digit)
-            return actual_instructions[key]
-        actual_instructions[key] = get_value(value)
-        return actual_instructions[key]
-
-    return get_value(wire)
+    circuit = Circuit(input_str)
+    for overridden_wire, value in (prior_instructions or {}).items():
+        circuit.override(overridden_wire, value)
+    return circuit[wire]
 
 
 # %%
@@ -193,3 +277,8 @@ print("Part One:", part_one_and_two(input_07, "a"))
 # %%
 part_two = part_one_and_two(input_07, "a", {"b": part_one})
 print("Part Two:", part_two)
+
+# %%
+circuit = Circuit(input_07)
+circuit.override("b", circuit["a"])
+print("Part Two:", circuit["a"])
@@ -43,15 +43,13 @@
 # string code (`2 + 5 + 10 + 6 = 23`) minus the total number of characters in
 # memory for string values (`0 + 3 + 7 + 1 = 11`) is `23 - 11 = 12`.
 
-# %%
-import pyperclip
-
 # %%
 input_08 = aoc_open_input("input_08.txt")
 test_08 = aoc_open_input("test_08.txt")
 
 
 # %%
+@aoc_answer_display
 def part_one(input_str: str) -> int:
     count_chars_string_code = 0
     count_mem_chars = 0
@@ -61,8 +59,6 @@ def part_one(input_str: str) -> int:
         count_mem_chars += len(eval(i))
 
     result = count_chars_string_code - count_mem_chars
-    pyperclip.copy(result)
-    print(result)
     return result
 
 
@@ -98,6 +94,7 @@ part_one(input_08)
 
 
 # %%
+@aoc_answer_display
 def part_two(input_str: str) -> int:
     count_code_repr = 0
     count_chars_string_code = 0
@@ -108,8 +105,6 @@ def part_two(input_str: str) -> int:
         count_chars_string_code += len(i)
 
     result = count_code_repr - count_chars_string_code
-    pyperclip.copy(result)
-    print(result)
     return result
 
 
@@ -33,9 +33,7 @@
 # What is the distance of the shortest route?
 
 # %%
-from itertools import pairwise, permutations
-
-import pyperclip
+import numpy as np
 
 # %%
 test = """London to Dublin = 464
@@ -46,6 +44,7 @@ input_09 = aoc_open_input("input_09.txt")
 
 
 # %%
+@aoc_answer_display
 def part_one_and_two(input_str: str, agg_type: str) -> int:
     """
     Calculate the minimum or maximum distance of trips based on given routes.
@@ -77,7 +76,11 @@ def part_one_and_two(input_str: str, agg_type: str) -> int:
     This function assumes a symmetric distance matrix, meaning that the distance
     from city A to city B is the same as the distance from city B to city A.
 
-    The result is copied to the clipboard using the Pyperclip library.
+    The best route is found with `aoc_held_karp` (a bitmask dynamic programme)
+    instead of trying every permutation of the cities.
+
+    The result is reported through the answer sink chosen by
+    `aoc_answer_display`.
 
     Examples
     --------
@@ -91,33 +94,30 @@ def part_one_and_two(input_str: str, agg_type: str) -> int:
     assert agg_type in {"min", "max"}, "`agg_type` must be 'min' or 'max'"
 
     routes = {}
-    cities = set()
+    cities = {}
 
     for line in input_str.splitlines():
         origin, _, destination, _, distance = line.split()
 
-        cities.add(origin)
-        cities.add(destination)
-
-        routes[(origin, destination)] = int(distance)
-        routes[(destination, origin)] = int(distance)
+        cities.setdefault(origin, len(cities))
+        cities.setdefault(destination, len(cities))
 
-    final_trips_lens = []
+        routes[(cities[origin], cities[destination])] = int(distance)
+        routes[(cities[destination], cities[origin])] = int(distance)
 
-    for trips in permutations(cities, len(cities)):
-        miles = sum(routes[trip] for trip in pairwise(trips))
-        final_trips_lens.append(miles)
+    distances = np.zeros((len(cities), len(cities)), dtype=np.int64)
+    for (origin, destination), distance in routes.items():
+        distances[origin, destination] = distance
 
-    result = min(final_trips_lens) if agg_type == "min" else max(final_trips_lens)
-    pyperclip.copy(result)
+    result = aoc_held_karp(distances, maximise=agg_type == "max")
     return result
 
 
 # %%
-print(part_one_and_two(test, "min"))
+part_one_and_two(test, "min")
 
 # %%
-print(part_one_and_two(input_09, "min"))
+part_one_and_two(input_09, "min")
 
 # %% [markdown]
 # ## -- Part Two ---
@@ -134,10 +134,10 @@ print(part_one_and_two(input_09, "min"))
 # What is the distance of the longest route?
 
 # %%
-print(part_one_and_two(test, "max"))
+part_one_and_two(test, "max")
 
 # %%
-print(part_one_and_two(input_09, "max"))
+part_one_and_two(input_09, "max")
 
 # %%
 part_one_and_two(test, "median")
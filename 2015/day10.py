@@ -26,9 +26,10 @@
 # Your puzzle input is `1113122113`.
 
 # %%
+from functools import cache
 from itertools import groupby
 
-import pyperclip
+import numpy as np
 
 # %%
 test = {
@@ -44,6 +45,59 @@ input_10 = "1113122113"
 
 
 # %%
+def look_and_say(x: str) -> str:
+    return "".join(f"{len(list(g))}{k}" for k, g in groupby(x))
+
+
+def look_and_say_step(digits: np.ndarray) -> np.ndarray:
+    """
+    Apply one 'look-and-say' round to an array of digits.
+
+    The runs are found with a single vectorised comparison and every run is
+    written out as its length followed by its digit, so no Python object is
+    created per digit. Runs of ten or more, which only arise from unusual
+    inputs, have their length written out one decimal digit at a time.
+
+    Examples
+    --------
+    >>> look_and_say_step(np.array([1] * 11, dtype=np.uint8))
+    array([1, 1, 1], dtype=uint8)
+    """
+    run_starts = np.flatnonzero(np.diff(digits, prepend=np.uint8(255)))
+    run_lengths = np.diff(run_starts, append=len(digits))
+
+    if run_lengths.max(initial=0) < 10:
+        result = np.empty(2 * len(run_starts), dtype=np.uint8)
+        result[0::2] = run_lengths
+        result[1::2] = digits[run_starts]
+        return result
+
+    length_digits = np.floor(np.log10(run_lengths)).astype(np.intp) + 1
+    ends = np.cumsum(length_digits + 1)
+    result = np.empty(ends[-1], dtype=np.uint8)
+    result[ends - 1] = digits[run_starts]
+    # Fill the length digits from the units up, only for runs that have them.
+    remaining, position = run_lengths, ends - 2
+    for place in range(length_digits.max()):
+        has_digit = length_digits > place
+        result[position[has_digit]] = remaining[has_digit] % 10
+        remaining, position = remaining // 10, position - 1
+    return result
+
+
+def look_and_say_digits(input_str: str, n_cycles: int) -> np.ndarray:
+    """
+    Apply `n_cycles` 'look-and-say' rounds and return the digits as a
+    ``uint8`` array (one byte per digit).
+    """
+    digits = np.frombuffer(input_str.encode(), dtype=np.uint8) - ord("0")
+    for _ in range(n_cycles):
+        digits = look_and_say_step(digits)
+    return digits
+
+
+# %%
+@aoc_answer_display
 def part_one(input_str: str, n_cycles: int = 1) -> int:
     """Apply the 'look-and-say' algorithm to the given input string.
 
@@ -75,20 +129,13 @@ def part_one(input_str: str, n_cycles: int = 1) -> int:
     >>> part_one('111222333')
     6
     """
-    look_and_say = lambda x: "".join(
-        [f"{''.join((str(len(list(g))), k))}" for k, g in groupby(x)]
-    )
-    result = look_and_say(input_str)
-    print(result)
-    for _ in range(cycles - 1):
-        result = look_and_say(result)
+    result = look_and_say_digits(input_str, n_cycles)
     length_result = len(result)
-    pyperclip.copy(length_result)
     return length_result
 
 
 # %%
-print(part_one(input_10, 40))
+part_one(input_10, 40)
 
 # %% [markdown]
 # ## --- Part Two ---
@@ -101,4 +148,113 @@ print(part_one(input_10, 40))
 # *50* times. What is *the length of the new result*?
 
 # %%
-print(part_one(input_10, 50))
+part_one(input_10, 50)
+
+
+# %% [markdown]
+# ### Conway's elements
+#
+# Conway showed that every 'look-and-say' string eventually splits into
+# "elements": substrings that evolve independently of their neighbours. There
+# are 92 common ones (plus two families of transuranic ones), and each element
+# decays into a fixed list of elements after one round. Counting how many of
+# each element there are is enough to know the length, so the length after
+# `n` rounds is `lengths @ decay_matrix**n @ counts` and the string itself is
+# never built.
+
+
+# %%
+SPLIT_HORIZON = 24
+SPLIT_PREFIX = 64
+
+
+def first_digits(right: str, n_rounds: int) -> list[str]:
+    """
+    First digit of ``right`` after 0, 1, ... ``n_rounds`` rounds, or fewer if
+    they can't be known from the first `SPLIT_PREFIX` digits.
+
+    Describing a prefix of a string gives a prefix of its description, except
+    for the last run, which may continue past the end of the prefix.
+    """
+    prefix, exact = right[:SPLIT_PREFIX], len(right) <= SPLIT_PREFIX
+    result = []
+    for _ in range(n_rounds + 1):
+        if not prefix:
+            break
+        result.append(prefix[0])
+        prefix = look_and_say(prefix) if exact else look_and_say(prefix)[:-2]
+        exact = exact and len(prefix) <= SPLIT_PREFIX
+        prefix = prefix[:SPLIT_PREFIX]
+    return result
+
+
+@cache
+def split_elements(x: str) -> tuple[str, ...]:
+    """
+    Split a string into the elements that evolve independently.
+
+    ``left + right`` evolves as ``left`` and ``right`` side by side as long as
+    the last digit of ``left`` (which never changes) differs from the first
+    digit of ``right`` in every round.
+    """
+    elements = []
+    start = 0
+    for i in range(1, len(x)):
+        digits = first_digits(x[i:], SPLIT_HORIZON)
+        if len(digits) > SPLIT_HORIZON and x[i - 1] not in digits:
+            elements.append(x[start:i])
+            start = i
+    elements.append(x[start:])
+    return tuple(elements)
+
+
+def decay_table(input_str: str) -> tuple[list[str], np.ndarray]:
+    """
+    Find every element reachable from the input and build the decay matrix,
+    where ``matrix[j, i]`` is how many times element ``j`` appears in the
+    decay of element ``i``.
+    """
+    elements = {element: None for element in split_elements(input_str)}
+    pending = list(elements)
+    decays = {}
+    while pending:
+        element = pending.pop()
+        decays[element] = split_elements(look_and_say(element))
+        for product in decays[element]:
+            if product not in elements:
+                elements[product] = None
+                pending.append(product)
+
+    names = list(elements)
+    index = {element: i for i, element in enumerate(names)}
+    matrix = np.zeros((len(names), len(names)), dtype=object)
+    for element, products in decays.items():
+        for product in products:
+            matrix[index[product], index[element]] += 1
+    return names, matrix
+
+
+def conway_length(input_str: str, n_cycles: int) -> int:
+    """
+    Length of the 'look-and-say' string after `n_cycles` rounds, computed on
+    element counts with an exact (``object`` dtype) matrix power.
+
+    Examples
+    --------
+    >>> conway_length("1", 5)
+    6
+    """
+    names, matrix = decay_table(input_str)
+    counts = np.zeros(len(names), dtype=object)
+    for element in split_elements(input_str):
+        counts[names.index(element)] += 1
+
+    lengths = np.array([len(name) for name in names], dtype=object)
+    return int(lengths @ np.linalg.matrix_power(matrix, n_cycles) @ counts)
+
+
+# %%
+print(conway_length(input_10, 50))
+
+# %%
+print(conway_length(input_10, 1000))
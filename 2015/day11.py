@@ -45,8 +45,8 @@
 
 # %%
 import re
-
-import pyperclip
+from collections.abc import Iterator
+from itertools import islice
 
 INPUT_11 = "hxbxwxba"
 
@@ -92,20 +92,105 @@ def is_valid_password(input_str: str) -> bool:
     )
 
 
+FORBIDDEN_DIGITS = {ord(char) - ord("a") for char in "iol"}
+
+
+def positions_needed(digit: int, state: tuple[bool, int, int, bool]) -> int:
+    """
+    Lower bound on how many more characters a prefix ending in `digit` with
+    the given rule `state` needs before it can become a valid password.
+    """
+    straight, run, pairs, pair_end = state
+
+    straight_needed = 0
+    if not straight:
+        straight_needed = 3 - run if digit + 3 - run <= 25 else 3
+
+    pairs_needed = 0
+    if pairs < 2:
+        # The next character can pair up with the current one
+        pairs_needed = 2 * (2 - pairs) - (not pair_end)
+
+    return max(straight_needed, pairs_needed)
+
+
+def valid_passwords(input_str: str, include_start: bool = True) -> Iterator[str]:
+    """
+    Yield every valid password from `input_str` onwards (or strictly after it
+    when `include_start` is False), in order.
+
+    The password is kept as a list of base-26 digits and the straight and pair
+    rules are tracked per position, so after an increment only the digits from
+    the changed position onwards are re-checked. Whenever a prefix contains
+    'i', 'o' or 'l', or is too short on characters left to ever satisfy the
+    rules, every password sharing that prefix is skipped in one step by
+    bumping the prefix and resetting the suffix to 'a'.
+    """
+    digits = [ord(char) - ord("a") for char in input_str]
+    start = digits.copy()
+    n = len(digits)
+    # (has straight, length of increasing run, pairs, position ends a pair)
+    states = [(False, 1, 0, False)] * n
+
+    def increment(k: int) -> int:
+        """Add one to the prefix ending at `k`, returning where it stopped."""
+        while k >= 0 and digits[k] == 25:
+            digits[k] = 0
+            k -= 1
+        if k >= 0:
+            digits[k] += 1
+        return k
+
+    k = 0
+    while True:
+        while k < n:
+            if k == 0:
+                state = (False, 1, 0, False)
+            else:
+                straight, run, pairs, pair_end = states[k - 1]
+                run = run + 1 if digits[k] == digits[k - 1] + 1 else 1
+                pair_end = digits[k] == digits[k - 1] and not pair_end
+                state = (straight or run >= 3, run, pairs + pair_end, pair_end)
+
+            if (
+                digits[k] in FORBIDDEN_DIGITS
+                or positions_needed(digits[k], state) > n - 1 - k
+            ):
+                digits[k + 1 :] = [0] * (n - k - 1)
+                k = increment(k)
+                if k < 0:
+                    return
+                continue
+
+            states[k] = state
+            k += 1
+
+        if include_start or digits != start:
+            yield "".join(chr(digit + ord("a")) for digit in digits)
+
+        k = increment(n - 1)
+        if k < 0:
+            return
+
+
+def next_passwords(input_str: str, k: int = 1) -> list[str]:
+    """The next `k` valid passwords after `input_str`."""
+    return list(islice(valid_passwords(input_str, include_start=False), k))
+
+
+@aoc_answer_display
 def part_one(input_str: str) -> str:
-    # count = 0
-    result = input_str
-    while not is_valid_password(result):
-        # count += 1
-        # print(count, "temp result", result)
-        result = increment_string(result)
-    pyperclip.copy(result)
-    print(result)
+    result = next(valid_passwords(input_str), None)
+    if result is None:
+        raise ValueError(
+            f"No valid {len(input_str)} letter password comes at or after "
+            f"{input_str!r}"
+        )
     return result
 
 
 # %%
-print(part_one(INPUT_11))
+part_one(INPUT_11)
 
 # %% [markdown]
 # ## --- Part Two ---
@@ -114,3 +199,6 @@ print(part_one(INPUT_11))
 
 # %%
 part_one(increment_string(part_one(INPUT_11)))
+
+# %%
+print(next_passwords(INPUT_11, 2))
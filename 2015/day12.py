@@ -23,9 +23,10 @@
 
 # %%
 import json
+import mmap
 import re
+from typing import BinaryIO
 
-import pyperclip
 from utilities import aoc_answer_display
 
 # %%
@@ -39,7 +40,7 @@ def part_one(input_str: str) -> int:
 
 
 # %%
-print(aoc_answer_display(part_one(INPUT_12)))
+aoc_answer_display(part_one(INPUT_12))
 
 # %% [markdown]
 # ## --- Part Two ---
@@ -59,14 +60,107 @@ print(aoc_answer_display(part_one(INPUT_12)))
 
 
 # %%
-def part_two(filename: str) -> int:
-    with open(filename, "r", encoding="utf-8") as file:
-        input_data = json.load(
-            file, object_hook=lambda obj: {} if "red" in obj.values() else obj
-        )
-    result = sum(map(int, re.findall(r"-?\d+", json.dumps(input_data))))
-    pyperclip.copy(result)
-    print(result)
+JSON_TOKEN = re.compile(
+    rb'"(?:[^"\\]|\\.)*(?:"|\\?\Z)'  # strings, possibly cut at the end of a chunk
+    rb"|-(?:\d[\d.eE+-]*)?|\d[\d.eE+-]*"  # numbers
+    rb"|[a-z]+"  # true, false and null
+    rb"|[{}\[\]:,]"
+)
+
+
+def sum_json_numbers(
+    stream: BinaryIO, ignore: str | None = None, chunk_size: int = 1 << 20
+) -> int:
+    """
+    Add up every number of a JSON document in a single streaming pass.
+
+    The document is read `chunk_size` bytes at a time and tokenised with a
+    regular expression; a token that may continue in the next chunk is carried
+    over. Objects keep their own running total on a stack and only hand it to
+    their parent when they close, so an object holding the value `ignore` is
+    dropped together with all of its children. Memory use depends on the
+    nesting depth, not on the size of the document.
+
+    Parameters
+    ----------
+    stream : BinaryIO
+        Anything with a ``read(size)`` method returning bytes, such as a file
+        opened in binary mode or an ``mmap``.
+    ignore : str | None, optional
+        Discard every object that has this string as one of its values, by
+        default None.
+    chunk_size : int, optional
+        Number of bytes read at a time, by default 1 MiB.
+
+    Returns
+    -------
+    int
+        The sum of all the numbers that were not discarded.
+
+    Examples
+    --------
+    >>> import io
+    >>> sum_json_numbers(io.BytesIO(b'[1,{"c":"red","b":2},3]'), ignore="red")
+    4
+    >>> sum_json_numbers(io.BytesIO(rb'[1,{"c":"r\\u0065d","b":2},3]'), ignore="red")
+    4
+    """
+    ignored_token = json.dumps(ignore).encode() if ignore is not None else None
+
+    # [total, is object, discarded, next string is a value]
+    stack = [[0, False, False, False]]
+    carry = b""
+
+    while True:
+        chunk = stream.read(chunk_size)
+        buffer = carry + chunk
+        carry = b""
+
+        for match in JSON_TOKEN.finditer(buffer):
+            if chunk and match.end() == len(buffer):
+                carry = buffer[match.start() :]
+                break
+
+            token = match.group()
+            frame = stack[-1]
+            first = token[0]
+
+            if first in b"-0123456789":
+                if not frame[2]:
+                    frame[0] += (
+                        int(token) if token.lstrip(b"-").isdigit() else float(token)
+                    )
+            elif first == ord('"'):
+                if frame[1] and frame[3] and ignored_token is not None:
+                    # Escaped spellings such as "r\u0065d" decode to `ignore`
+                    # too, so only tokens with a backslash need decoding.
+                    if token == ignored_token or (
+                        b"\\" in token and json.loads(token) == ignore
+                    ):
+                        frame[2] = True
+            elif first == ord("{"):
+                stack.append([0, True, False, False])
+            elif first == ord("["):
+                stack.append([0, False, False, False])
+            elif first in b"}]":
+                stack.pop()
+                if not frame[2]:
+                    stack[-1][0] += frame[0]
+            elif first == ord(":"):
+                frame[3] = True
+            elif first == ord(","):
+                frame[3] = False
+
+        if not chunk:
+            return stack[0][0]
+
+
+@aoc_answer_display
+def part_two(filename: str, ignore: str = "red") -> int:
+    with open(filename, "rb") as file, mmap.mmap(
+        file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as document:
+        result = sum_json_numbers(document, ignore=ignore)
     return result
 
 
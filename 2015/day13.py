@@ -56,7 +56,8 @@
 
 # %%
 from collections import defaultdict
-from itertools import permutations
+
+import numpy as np
 
 # %%
 INPUT_13 = aoc_open_input("input_13.txt")
@@ -96,7 +97,7 @@ def solution(input_str: str, joining_dinner: bool = False) -> int:
         The maximum total happiness achievable for any seating arrangement.
     """
     scores = defaultdict(int)
-    guests = set()
+    guests = {}
 
     # Parse input string and update scores and guests
     for line in (
@@ -108,22 +109,20 @@ def solution(input_str: str, joining_dinner: bool = False) -> int:
         parts = line.split()
         person, happiness, next_person = parts[0], int(parts[2]), parts[-1]
 
-        guests.add(person)
+        guests.setdefault(person, len(guests))
         scores[(person, next_person)] = happiness
 
-    # If joining dinner, add Daniel to the guests
-    if joining_dinner:
-        guests.add("Daniel")
-
-    # Calculate happiness for all permutations
-    best = 0
-    for arrangement in permutations(guests):
-        happiness_neighbors = sum(
-            scores[(arrangement[i], arrangement[(i + 1) % len(arrangement)])]
-            + scores[(arrangement[i], arrangement[(i - 1) % len(arrangement)])]
-            for i in range(len(arrangement))
-        )
-        best = max(best, happiness_neighbors)
+    # Both neighbours' happiness changes count for every pair sitting together
+    happiness = np.zeros((len(guests), len(guests)), dtype=np.int64)
+    for (person, next_person), change in scores.items():
+        i, j = guests[person], guests[next_person]
+        happiness[i, j] += change
+        happiness[j, i] += change
+
+    # If joining dinner, add Daniel to the guests at no happiness cost
+    best = aoc_held_karp(
+        happiness, cycle=True, maximise=True, add_zero_node=joining_dinner
+    )
 
     return best
 
@@ -34,6 +34,7 @@
 # %%
 import re
 
+import numpy as np
 import pandas as pd
 from IPython.display import display
 
@@ -66,49 +67,61 @@ def parse_reindeer_specs(input_str: str) -> dict[str, dict[str, int]]:
     return reindeer_specs
 
 
+def specs_to_arrays(
+    reindeer_specs: dict[str, dict[str, int]],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Speed, flight time and rest time of every reindeer as int64 arrays."""
+    return tuple(
+        np.array([specs[key] for specs in reindeer_specs.values()], dtype=np.int64)
+        for key in ("speed", "flight_time", "rest_time")
+    )
+
+
+def distances_at(
+    speed: np.ndarray, flight_time: np.ndarray, rest_time: np.ndarray, time: np.ndarray
+) -> np.ndarray:
+    """
+    Closed-form distance travelled by every reindeer after `time` seconds.
+
+    Each fly-and-rest cycle covers ``speed * flight_time`` km, so only the
+    seconds of flight in the last, unfinished cycle have to be added. With a
+    column of reindeer parameters and a row of times this broadcasts to a
+    ``(reindeer, time)`` matrix.
+
+    Examples
+    --------
+    >>> distances_at(*specs_to_arrays(parse_reindeer_specs(test)), 1000)
+    array([1120, 1056])
+    """
+    full_cycles, remainder = np.divmod(time, flight_time + rest_time)
+    return speed * (full_cycles * flight_time + np.minimum(remainder, flight_time))
+
+
 def calculate_total_miles(
-    reindeer_specs: dict[str, dict[str, int]], time_threshold: int
+    reindeer_specs: dict[str, dict[str, int]],
+    time_threshold: int,
+    display_table: bool = False,
 ) -> int:
-    total_miles = []
-
-    for _, specs in reindeer_specs.items():
-        turns = 0
-        time = 0
-        miles = 0
-
-        speed = specs["speed"]
-        flight_time = specs["flight_time"]
-        rest_time = specs["rest_time"]
-
-        while time < time_threshold:
-            flight_turn = turns % 2 == 0
-
-            if flight_turn:
-                time_left = time_threshold - time
-                if time_left > (speed * flight_time):
-                    miles += speed * flight_time
-                    time += flight_time
-                    time_left -= flight_time
-                else:
-                    miles += speed * min(time_left, flight_time)
-                    time += time_left
-            elif time_left > rest_time:
-                time += rest_time
-                time_left -= rest_time
-            else:
-                time += time_left
-                time_left = 0
-
-            turns += 1
-
-        total_miles.append(miles)
-        specs["total_travelled"] = miles
-
-    display(
-        pd.DataFrame(reindeer_specs).T.sort_values("total_travelled", ascending=False)
-    )
+    """
+    Distance covered by the winning reindeer after `time_threshold` seconds.
+
+    Examples
+    --------
+    >>> calculate_total_miles(parse_reindeer_specs(test), 1000)
+    1120
+    """
+    total_miles = distances_at(*specs_to_arrays(reindeer_specs), time_threshold)
 
-    return max(total_miles)
+    if display_table:
+        for specs, miles in zip(reindeer_specs.values(), total_miles.tolist()):
+            specs["total_travelled"] = miles
+        display(
+            pd.DataFrame(reindeer_specs).T.sort_values(
+                "total_travelled", ascending=False
+            )
+        )
+
+    return int(total_miles.max())
 
 
 def part_one(input_str: str, time_threshold: int) -> int:
@@ -156,42 +169,68 @@ test_specs
 
 # %%
 def max_pole_position_count(
-    reindeer_specs: dict[str, dict[str, int]], time_threshold: int
+    reindeer_specs: dict[str, dict[str, int]],
+    time_threshold: int,
+    plot: bool = False,
+    block_size: int = 1 << 14,
 ) -> int:
-    position_sec_by_sec = {}
-
-    for r, s in reindeer_specs.items():
-        position = []
-        miles = 0
-        turns = 0
-
-        speed, flight_time, rest_time = s.values()
-
-        while len(position) < time_threshold:
-            if turns % 2 == 0:
-                for _ in range(flight_time):
-                    miles += speed
-                    position.append(miles)
-
-            else:
-                for _ in range(rest_time):
-                    miles += 0
-                    position.append(miles)
-
-            turns += 1
-        position_sec_by_sec[r] = position[:time_threshold]
-
-    all_pos = pd.DataFrame(position_sec_by_sec)
-    all_pos.plot(title="Positions")
-    final_results = (
-        all_pos.T.pipe(lambda d: (d >= d.max()))
-        .T.map(int)
-        .sum()
-        .sort_values(ascending=False)
-    )
-
-    display(final_results.to_frame("Pole Position Counts"))
-    return final_results.max()
+    """
+    Award a point every second to the reindeer in the lead and return the
+    winner's points.
+
+    The race is scored in blocks of `block_size` seconds: `distances_at` gives
+    the ``(reindeer, second)`` distance matrix of a block in one go, the
+    leaders of every second are found with a column-wise maximum and their
+    points are summed per row.
+
+    A reindeer is never more than ``speed * flight_time * rest_time / cycle``
+    km ahead of its average pace, so one with a lower average speed than the
+    fastest can only lead until a known second. Those reindeer are dropped
+    from the later blocks, and once a single candidate is left it takes every
+    remaining point at once.
+    """
+    speed, flight_time, rest_time = specs_to_arrays(reindeer_specs)
+    points = np.zeros(len(reindeer_specs), dtype=np.int64)
+
+    cycle = flight_time + rest_time
+    average_speed = speed * flight_time / cycle
+    slack = speed * flight_time * rest_time / cycle
+    gap = average_speed.max() - average_speed
+    last_lead = np.full(len(reindeer_specs), np.inf)
+    behind = gap > 0
+    last_lead[behind] = np.floor(slack[behind] / gap[behind]) + 2
+
+    for start in range(1, time_threshold + 1, block_size):
+        candidates = np.flatnonzero(last_lead >= start)
+        if len(candidates) == 1:
+            points[candidates] += time_threshold - start + 1
+            break
+
+        seconds = np.arange(start, min(start + block_size, time_threshold + 1))
+        distances = distances_at(
+            speed[candidates, None],
+            flight_time[candidates, None],
+            rest_time[candidates, None],
+            seconds,
+        )
+        points[candidates] += (distances == distances.max(axis=0)).sum(axis=1)
+
+    if plot:
+        seconds = np.arange(1, time_threshold + 1)
+        pd.DataFrame(
+            distances_at(
+                speed[:, None], flight_time[:, None], rest_time[:, None], seconds
+            ).T,
+            index=seconds,
+            columns=list(reindeer_specs),
+        ).plot(title="Positions")
+        display(
+            pd.Series(points, index=list(reindeer_specs))
+            .sort_values(ascending=False)
+            .to_frame("Pole Position Counts")
+        )
+
+    return int(points.max())
 
 
 # %%
@@ -46,7 +46,10 @@
 # **total score** of the highest-scoring cookie you can make?
 
 # %%
-from itertools import permutations
+from collections.abc import Iterator
+from itertools import combinations, islice
+from math import comb
+from operator import mul
 import pandas as pd
 import numpy as np
 import re
@@ -77,30 +80,189 @@ def ingredient_stats(input_str: str, verbose: bool = True):
 
 
 # %%
-def find_permutations(numbers, target_sum: int, factors: int):
-    return np.fromiter(
-        (comb for comb in permutations(numbers, factors) if sum(comb) == target_sum),
-        dtype=np.dtype((int, factors)),
+def compositions(
+    total: int, parts: int, chunk_size: int = 1 << 16
+) -> Iterator[np.ndarray]:
+    """
+    Every way of splitting `total` into `parts` non-negative amounts, as
+    ``(m, parts)`` arrays of at most `chunk_size` rows.
+
+    Stars and bars: choosing where the ``parts - 1`` bars go among
+    ``total + parts - 1`` slots gives each composition exactly once, so no
+    candidate has to be generated and then filtered on its sum.
+    """
+    if parts == 1:
+        yield np.array([[total]])
+        return
+
+    bars = combinations(range(total + parts - 1), parts - 1)
+    while (
+        chunk := np.fromiter(
+            islice(bars, chunk_size), dtype=np.dtype((np.int64, parts - 1))
+        )
+    ).size:
+        yield np.diff(chunk, axis=1, prepend=-1, append=total + parts - 1) - 1
+
+
+def recipe_scores(
+    amounts: np.ndarray,
+    ingredient_data: pd.DataFrame,
+    calorie_restriction: int | None = None,
+) -> np.ndarray:
+    """
+    Score a batch of recipes: the product of the clamped property totals, or
+    0 for recipes that miss the calorie restriction.
+    """
+    properties = ingredient_data.drop(index="calories", errors="ignore")
+    totals = amounts @ properties.values.T
+    scores = np.maximum(totals, 0).prod(axis=1)
+
+    if calorie_restriction is not None:
+        calories = amounts @ ingredient_data.loc["calories"].values
+        scores[calories != calorie_restriction] = 0
+    return scores
+
+
+def best_recipe_score(
+    ingredient_data: pd.DataFrame,
+    calorie_restriction: int | None = None,
+    teaspoons: int = 100,
+    verbose: bool = False,
+) -> int:
+    """
+    Best score over every composition, scored one bounded chunk at a time.
+    """
+    all_scores = []
+    best = 0
+    for amounts in compositions(teaspoons, ingredient_data.shape[1]):
+        scores = recipe_scores(amounts, ingredient_data, calorie_restriction)
+        best = max(best, int(scores.max()))
+        if verbose:
+            all_scores.append(pd.Series(scores, index=map(tuple, amounts)))
+
+    if verbose:
+        return pd.concat(all_scores).pipe(z_descriptive_min_max, "max")
+    return best
+
+
+def branch_and_bound_score(
+    ingredient_data: pd.DataFrame,
+    calorie_restriction: int | None = None,
+    teaspoons: int = 100,
+    coarse_recipes: int = 1 << 14,
+) -> int:
+    """
+    Best score found by assigning one ingredient at a time and pruning every
+    partial recipe that can't beat the best one found so far.
+
+    Two bounds cap the score of every recipe that completes a partial one:
+
+    - each property can at most grow by the remaining teaspoons times its
+      largest value among the remaining ingredients;
+    - by the weighted AM-GM inequality, ``prod(L) <= (w @ L / k)**k / prod(w)``
+      for any positive weights ``w`` over the ``k`` properties. ``w @ L`` is
+      linear, so it peaks when every remaining teaspoon goes to a single
+      ingredient. With ``w = 1 / L*`` for the property totals ``L*`` of the
+      best recipe so far, the bound is tight around that recipe and a branch
+      can only beat it if ``w @ L > k``.
+
+    The search starts from the best recipe of a coarse grid of about
+    `coarse_recipes` recipes. With a calorie restriction, partial recipes that
+    can no longer hit the target exactly are pruned as well. The last three
+    ingredients are not branched on but scored in one go.
+    """
+    properties = ingredient_data.drop(index="calories", errors="ignore")
+    values = properties.values.T.tolist()
+    calories = (
+        ingredient_data.loc["calories"].tolist()
+        if calorie_restriction is not None
+        else [0] * len(values)
     )
+    n, k = len(values), len(properties)
+    tail = min(3, n)
+    tail_values = properties.values[:, n - tail :].T
+    tail_calories = np.array(calories[n - tail :])
+    tail_amounts = {}
+
+    # Largest value of each property, and calorie range, among ingredients i..
+    most = [np.max(properties.values[:, i:], axis=1).tolist() for i in range(n)]
+    fewest_calories = [min(calories[i:]) for i in range(n)]
+    most_calories = [max(calories[i:]) for i in range(n)]
+    target = calorie_restriction or 0
+
+    best = 0
+    threshold = 0
+
+    def reweight(new_weights: list[float]) -> None:
+        nonlocal weights, most_weighted
+        weights = new_weights
+        weighted = [sum(map(mul, weights, value)) for value in values]
+        most_weighted = [max(weighted[i:]) for i in range(n)]
+
+    def improve(score: int, totals: list[int]) -> None:
+        nonlocal best, threshold
+        best, threshold = score, k
+        reweight([1 / total for total in totals])
+
+    weights, most_weighted = [], []
+    reweight([1.0] * k)
+
+    # Seed the incumbent with the best recipe of a coarse grid
+    step = 1
+    while comb(teaspoons // step + n - 1, n - 1) > coarse_recipes:
+        step += 1
+    amounts = np.concatenate(list(compositions(teaspoons // step, n))) * step
+    amounts[:, 0] += teaspoons % step
+    scores = recipe_scores(amounts, ingredient_data, calorie_restriction)
+    if scores.max() > 0:
+        improve(int(scores.max()), (amounts[scores.argmax()] @ values).tolist())
+
+    def search(i: int, remaining: int, totals: list[int], calorie_count: int):
+        if not (
+            remaining * fewest_calories[i]
+            <= target - calorie_count
+            <= remaining * most_calories[i]
+        ):
+            return
+
+        if sum(map(mul, weights, totals)) + remaining * most_weighted[i] <= threshold:
+            return
+
+        bound = 1
+        for total, largest in zip(totals, most[i]):
+            bound *= max(total + remaining * largest, 0)
+        if bound <= best:
+            return
+
+        if i == n - tail:
+            if remaining not in tail_amounts:
+                tail_amounts[remaining] = np.concatenate(
+                    list(compositions(remaining, tail))
+                )
+            amounts = tail_amounts[remaining]
+            recipe_totals = totals + amounts @ tail_values
+            scores = np.maximum(recipe_totals, 0).prod(axis=1)
+            if calorie_restriction is not None:
+                scores[calorie_count + amounts @ tail_calories != target] = 0
+            if scores.max() > best:
+                improve(int(scores.max()), recipe_totals[scores.argmax()].tolist())
+            return
+
+        for amount in range(remaining, -1, -1):
+            search(
+                i + 1,
+                remaining - amount,
+                [total + amount * value for total, value in zip(totals, values[i])],
+                calorie_count + amount * calories[i],
+            )
+
+    search(0, teaspoons, [0] * k, 0)
+    return best
 
 
 # %%
 def max_total_score(ingredient_data: pd.DataFrame, verbose: bool = False) -> int:
-    factor_count = ingredient_data.shape[1]
-    perms = find_permutations(range(101), 100, factor_count)
-    return (
-        pd.DataFrame(
-            np.dot(
-                perms,
-                ingredient_data.T.values,
-            ),
-            index=map(tuple, perms),
-            columns=ingredient_data.index,
-        )
-        .map(lambda x: max(x, 0))
-        .prod(axis=1)
-        .pipe(lambda d: d.pipe(z_descriptive_min_max, "max") if verbose else d.max())
-    )
+    return best_recipe_score(ingredient_data, verbose=verbose)
 
 
 # %%
@@ -141,23 +303,7 @@ part_one(INPUT_15, True)
 def max_total_score_with_calorie_restriction(
     ingredient_data: pd.DataFrame, calorie_restriction: int = 500, verbose: bool = False
 ) -> int:
-    factor_count = ingredient_data.shape[1]
-    perms = find_permutations(range(101), 100, factor_count)
-    return (
-        pd.DataFrame(
-            np.dot(
-                perms,
-                ingredient_data.T.values,
-            ),
-            index=map(tuple, perms),
-            columns=ingredient_data.index,
-        )
-        .map(lambda x: max(x, 0))
-        .loc[lambda d: d["calories"] == calorie_restriction]
-        .iloc[:, :4]
-        .prod(axis=1)
-        .pipe(lambda d: d.pipe(z_descriptive_min_max, "max") if verbose else d.max())
-    )
+    return best_recipe_score(ingredient_data, calorie_restriction, verbose=verbose)
 
 
 # %%
@@ -173,3 +319,7 @@ part_two(test, True)
 # %%
 aoc_answer_display(part_two(INPUT_15))
 part_two(INPUT_15, True)
+
+# %%
+aoc_answer_display(branch_and_bound_score(ingredient_stats(INPUT_15).iloc[:4]))
+aoc_answer_display(branch_and_bound_score(ingredient_stats(INPUT_15), 500))
@@ -17,7 +17,7 @@
 # containers** can exactly fit all `150` liters of eggnog?
 
 # %%
-from itertools import combinations
+import numpy as np
 
 # %%
 test = [20, 15, 10, 5, 5]
@@ -46,12 +46,26 @@ INPUT_17 = """50
 
 
 # %%
+def subset_count_table(containers: list[int], size: int) -> np.ndarray:
+    """
+    Count the subsets of containers by number of containers and total volume.
+
+    ``table[k, s]`` is how many ways there are to pick ``k`` containers that
+    hold exactly ``s`` litres. Every container updates the whole table with
+    one shifted NumPy row addition, so this takes O(n² · size) integer
+    operations instead of enumerating all 2ⁿ subsets.
+    """
+    table = np.zeros((len(containers) + 1, size + 1), dtype=np.int64)
+    table[0, 0] = 1
+    for container in containers:
+        if container <= size:
+            # NumPy buffers overlapping operands, so each container counts once
+            table[1:, container:] += table[:-1, : size + 1 - container]
+    return table
+
+
 def combos_for_size(containers: list[int], size: int) -> int:
-    return sum(
-        sum(c) == size
-        for count in range(len(containers))
-        for c in combinations(containers, count + 1)
-    )
+    return int(subset_count_table(containers, size)[1:, size].sum())
 
 
 # %%
@@ -75,15 +89,11 @@ combos_for_size([int(_) for _ in INPUT_17.splitlines()], 150)
 # In the example above, the minimum number of containers was two. There were
 # three ways to use that many containers, and so the answer there would be `3`.
 
+
 # %%
 def combos_for_min_size(containers: list[int], size: int) -> int:
-    min_count = next(
-        count
-        for count in range(len(containers))
-        for c in combinations(containers, count + 1)
-        if sum(c) == size
-    )
-    return sum(sum(c) == size for c in combinations(containers, min_count + 1))
+    counts = subset_count_table(containers, size)[1:, size]
+    return int(counts[counts.nonzero()[0][0]])
 
 
 # %%
@@ -92,8 +92,9 @@
 # lights are on after 100 steps**?
 
 # %%
+from collections.abc import Callable
+
 import numpy as np
-from scipy.ndimage import generic_filter
 
 # from utilities import aoc_adjacent_coordinates, aoc_filter_valid_coordinates, aoc_grid
 
@@ -109,10 +110,20 @@ INPUT_18 = aoc_open_input("input_18.txt")
 
 
 # %%
-def state_of_light(neighbors: np.ndarray) -> bool:
-    light = neighbors[4]
-    on = np.sum(neighbors)
-    return light and on in {3, 4} or not light and on == 3
+NEIGHBOUR_OFFSETS = [
+    (dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if (dr, dc) != (0, 0)
+]
+
+
+def parse_rule(rule: str) -> tuple[list[int], list[int]]:
+    """
+    Neighbour counts that turn a light on and keep it on, from a rule string
+    such as ``"B3/S23"``.
+    """
+    parts = {
+        part[0]: [int(count) for count in part[1:]] for part in rule.upper().split("/")
+    }
+    return parts.get("B", []), parts.get("S", [])
 
 
 def print_grid(grid: np.ndarray):
@@ -120,22 +131,164 @@ def print_grid(grid: np.ndarray):
         print("".join([".#"[i] for i in row]))
 
 
+def life_steps(
+    grid: np.ndarray,
+    steps: int,
+    rule: str = "B3/S23",
+    stuck: np.ndarray | None = None,
+    callback: Callable[[int, np.ndarray], None] | None = None,
+) -> np.ndarray:
+    """
+    Animate the lights on ``uint8`` buffers with a border of lights that are
+    always off.
+
+    Every step sums the eight shifted views of the current buffer plus nine
+    times the cell itself, and looks the next state up in an 18-entry table
+    indexed by ``9 * cell + neighbours``. The two buffers are swapped between
+    steps, so nothing is allocated inside the loop. Lights in `stuck` are
+    forced on after every step.
+    """
+    h, w = grid.shape
+    birth, survival = parse_rule(rule)
+    table = np.zeros(18, dtype=np.uint8)
+    table[birth] = 1
+    table[[9 + count for count in survival]] = 1
+
+    current = np.zeros((h + 2, w + 2), dtype=np.uint8)
+    following = np.zeros_like(current)
+    current[1:-1, 1:-1] = grid
+    counts = np.empty((h, w), dtype=np.uint8)
+    stuck_lights = None if stuck is None else stuck.astype(np.uint8)
+    if stuck_lights is not None:
+        current[1:-1, 1:-1] |= stuck_lights
+
+    for step in range(steps):
+        np.multiply(current[1:-1, 1:-1], 9, out=counts)
+        for dr, dc in NEIGHBOUR_OFFSETS:
+            np.add(
+                counts, current[1 + dr : h + 1 + dr, 1 + dc : w + 1 + dc], out=counts
+            )
+
+        inner = following[1:-1, 1:-1]
+        np.take(table, counts, out=inner, mode="clip")
+        if stuck_lights is not None:
+            np.bitwise_or(inner, stuck_lights, out=inner)
+
+        current, following = following, current
+        if callback:
+            callback(step + 1, current[1:-1, 1:-1].astype(bool))
+
+    return current[1:-1, 1:-1].astype(bool)
+
+
+def pack_rows(grid: np.ndarray) -> np.ndarray:
+    """Pack every row of a boolean grid into ``uint64`` words, 64 cells each."""
+    h, w = grid.shape
+    bits = np.zeros((h, -(-w // 64) * 64), dtype=bool)
+    bits[:, :w] = grid
+    return np.packbits(bits, axis=1, bitorder="little").view("<u8")
+
+
+def unpack_rows(words: np.ndarray, width: int) -> np.ndarray:
+    bits = np.unpackbits(words.view(np.uint8), axis=1, bitorder="little")
+    return bits[:, :width].astype(bool)
+
+
+def life_steps_packed(
+    grid: np.ndarray,
+    steps: int,
+    rule: str = "B3/S23",
+    stuck: np.ndarray | None = None,
+    callback: Callable[[int, np.ndarray], None] | None = None,
+) -> np.ndarray:
+    """
+    Same as `life_steps`, on rows bit-packed into ``uint64`` words.
+
+    The eight neighbour boards are added bitwise into four bit planes (a
+    ripple-carry adder working on 64 cells per word), and the rule is applied
+    by matching the planes against each count of the rule.
+    """
+    h, w = grid.shape
+    birth, survival = parse_rule(rule)
+    one, carry_bit = np.uint64(1), np.uint64(63)
+
+    board = pack_rows(grid)
+    inside = pack_rows(np.ones_like(grid, dtype=bool))
+    stuck_bits = None if stuck is None else pack_rows(stuck)
+    if stuck_bits is not None:
+        board |= stuck_bits
+
+    def matches(planes: list[np.ndarray], count: int) -> np.ndarray:
+        result = inside.copy()
+        for bit, plane in enumerate(planes):
+            result &= plane if count >> bit & 1 else ~plane
+        return result
+
+    for step in range(steps):
+        west = board << one
+        west[:, 1:] |= board[:, :-1] >> carry_bit
+        east = board >> one
+        east[:, :-1] |= board[:, 1:] << carry_bit
+
+        planes = [np.zeros_like(board) for _ in range(4)]
+        for columns in (west, board, east):
+            for dr in (-1, 0, 1):
+                if columns is board and dr == 0:
+                    continue
+                neighbour = np.zeros_like(board)
+                if dr == -1:
+                    neighbour[1:] = columns[:-1]
+                elif dr == 1:
+                    neighbour[:-1] = columns[1:]
+                else:
+                    neighbour[:] = columns
+                for bit in range(4):
+                    planes[bit], neighbour = (
+                        planes[bit] ^ neighbour,
+                        planes[bit] & neighbour,
+                    )
+
+        born = np.zeros_like(board)
+        for count in birth:
+            born |= matches(planes, count)
+        survives = np.zeros_like(board)
+        for count in survival:
+            survives |= matches(planes, count)
+
+        board = (~board & born) | (board & survives)
+        if stuck_bits is not None:
+            board |= stuck_bits
+        if callback:
+            callback(step + 1, unpack_rows(board, w))
+
+    return unpack_rows(board, w)
+
+
 def take_steps(
-    grid: np.ndarray, steps: int, partb: bool = False, verbose: bool = False
+    grid: np.ndarray,
+    steps: int,
+    partb: bool = False,
+    verbose: bool = False,
+    rule: str = "B3/S23",
+    packed: bool = False,
 ):
+    stuck = None
+    if partb:
+        stuck = np.zeros_like(grid, dtype=bool)
+        stuck[:: len(grid) - 1, :: len(grid[0]) - 1] = True
+
+    callback = None
     if verbose:
         print("Initial state:")
         print_grid(grid)
-    for i in range(steps):
-        new_grid = generic_filter(grid, state_of_light, size=3, mode="constant")
-        if partb:
-            new_grid[:: len(new_grid) - 1, :: len(new_grid[0]) - 1] = True
-        if verbose:
+
+        def callback(step: int, grid: np.ndarray):
             print()
-            print(f"After step {i + 1}:")
-            print_grid(new_grid)
-        grid = new_grid
-    return grid
+            print(f"After step {step}:")
+            print_grid(grid)
+
+    stepper = life_steps_packed if packed else life_steps
+    return stepper(grid, steps, rule, stuck, callback)
 
 
 def generate_grid(input_str: str) -> np.ndarray:
@@ -62,6 +62,8 @@ test_molecule = "HOHCh"
 
 # %%
 import re
+from heapq import heappop, heappush
+from typing import Iterator
 
 
 def load_input(filename: str = "input_19.txt") -> tuple[list[tuple[str, str]], str]:
@@ -82,13 +84,173 @@ def make_combinations(s: str, replacements: list[tuple[str, str]]):
     return combinations
 
 
+ELEMENT = re.compile(r"[A-Z][a-z]*|e")
+HASH_MOD = (1 << 61) - 1
+HASH_BASE = 1_000_003
+
+
+class MoleculeEngine:
+    """
+    Replacement rules compiled over element IDs.
+
+    Every element (``"e"``, ``"Ca"``, ``"Rn"``, ...) gets a one-byte ID, so a
+    molecule becomes a ``bytes`` object that is tokenised once and can then
+    be searched and spliced with fast bytes operations.
+
+    Parameters
+    ----------
+    replacements : list[tuple[str, str]]
+        The ``(element, replacement)`` rules.
+
+    Examples
+    --------
+    >>> engine = MoleculeEngine([("e", "H"), ("e", "O"), ("H", "HO"), ("H", "OH"), ("O", "HH")])
+    >>> engine.count_replacements("HOH")
+    4
+    >>> engine.steps_from_electron("HOHOHO")
+    6
+    """
+
+    def __init__(self, replacements: list[tuple[str, str]]) -> None:
+        self.ids: dict[str, int] = {}
+        self.rules = [
+            (self.encode(key), self.encode(value)) for key, value in replacements
+        ]
+        self.electron = self.encode("e")
+
+    def encode(self, molecule: str) -> bytes:
+        return bytes(
+            self.ids.setdefault(element, len(self.ids))
+            for element in ELEMENT.findall(molecule)
+        )
+
+    def count_replacements(self, molecule: str) -> int:
+        """
+        Number of distinct molecules one replacement away from `molecule`.
+
+        Instead of building every candidate string, each (position,
+        replacement) pair is reduced to a polynomial hash of the resulting
+        element sequence, computed in O(1) from prefix hashes.
+        """
+        tokens = self.encode(molecule)
+        n = len(tokens)
+
+        prefix = [0] * (n + 1)
+        for i, token in enumerate(tokens):
+            prefix[i + 1] = (prefix[i] * HASH_BASE + token + 1) % HASH_MOD
+
+        longest = max((len(value) for _, value in self.rules), default=0)
+        power = [1] * (n + longest + 1)
+        for i in range(1, len(power)):
+            power[i] = power[i - 1] * HASH_BASE % HASH_MOD
+
+        def sequence_hash(sequence: bytes) -> int:
+            result = 0
+            for token in sequence:
+                result = (result * HASH_BASE + token + 1) % HASH_MOD
+            return result
+
+        results = set()
+        for key, value in self.rules:
+            value_hash = sequence_hash(value)
+            start = tokens.find(key)
+            while start != -1:
+                end = start + len(key)
+                suffix = (prefix[n] - prefix[end] * power[n - end]) % HASH_MOD
+                head = (prefix[start] * power[len(value)] + value_hash) % HASH_MOD
+                results.add((head * power[n - end] + suffix) % HASH_MOD)
+                start = tokens.find(key, start + 1)
+        return len(results)
+
+    def reductions(self, tokens: bytes) -> Iterator[bytes]:
+        """
+        Molecules one reverse replacement away from `tokens`, most promising
+        first: the rightmost match, and on ties the rule that shrinks the
+        molecule the most.
+        """
+        if any(key == self.electron and value == tokens for key, value in self.rules):
+            yield self.electron
+        matches = []
+        for key, value in self.rules:
+            if key == self.electron:
+                continue
+            start = tokens.find(value)
+            while start != -1:
+                matches.append((start + len(value), len(value) - len(key), start, key))
+                start = tokens.find(value, start + 1)
+        matches.sort(reverse=True)
+        for end, _, start, key in matches:
+            yield tokens[:start] + key + tokens[end:]
+
+    def steps_from_electron(self, molecule: str, optimal: bool = False) -> int:
+        """
+        Fewest replacements that turn ``"e"`` into `molecule`.
+
+        The molecule is reduced back to ``"e"`` by applying the rules in
+        reverse. By default this is a depth-first search that always tries the
+        most promising reduction first and memoises the molecules that turned
+        out to be dead ends; the first path found is the minimum for the
+        puzzle's grammar, where every derivation has the same length. With
+        `optimal` the search becomes A*, ordered by steps taken plus a lower
+        bound on the steps left, which guarantees the minimum for any rule
+        set at the cost of a much wider search.
+        """
+        target = self.encode(molecule)
+        if optimal:
+            return self._shortest_reduction(target)
+
+        dead: set[bytes] = set()
+        path = [target]
+        candidates = [self.reductions(target)]
+        while path:
+            if path[-1] == self.electron:
+                return len(path) - 1
+            for reduced in candidates[-1]:
+                if reduced not in dead and reduced not in path:
+                    path.append(reduced)
+                    candidates.append(self.reductions(reduced))
+                    break
+            else:
+                dead.add(path.pop())
+                candidates.pop()
+
+        raise ValueError("The molecule can't be made from a single electron")
+
+    def _shortest_reduction(self, target: bytes) -> int:
+        shrink = max(1, max(len(value) - len(key) for key, value in self.rules))
+
+        def lower_bound(tokens: bytes) -> int:
+            return -(-(len(tokens) - 1) // shrink)
+
+        seen = {target: 0}
+        frontier = [(lower_bound(target), len(target), 0, target)]
+        while frontier:
+            _, _, steps, tokens = heappop(frontier)
+            if tokens == self.electron:
+                return steps
+            if seen[tokens] < steps:
+                continue
+            for reduced in self.reductions(tokens):
+                if steps + 1 < seen.get(reduced, steps + 2):
+                    seen[reduced] = steps + 1
+                    heappush(
+                        frontier,
+                        (
+                            steps + 1 + lower_bound(reduced),
+                            len(reduced),
+                            steps + 1,
+                            reduced,
+                        ),
+                    )
+
+        raise ValueError("The molecule can't be made from a single electron")
+
+
 def part_one():
     replacements, initial = load_input()
 
     # Part one
-    combinations = make_combinations(initial, replacements)
-    print("Part One:", len(combinations))
-
+    print("Part One:", MoleculeEngine(replacements).count_replacements(initial))
 
 
 # %% [markdown]
@@ -124,8 +286,14 @@ def part_one():
 # **replacements** and the **medicine molecule** in your puzzle input, what is
 # the **fewest number of steps** to go from `e` to the medicine molecule?
 
+
 # %%
+def part_two():
+    replacements, initial = load_input()
+    print("Part Two:", MoleculeEngine(replacements).steps_from_electron(initial))
+
 
 # %%
 if __name__ == "__main__":
     part_one()
+    part_two()
@@ -1,49 +1,26 @@
+import os
+import sys
 import numpy as np
-import pyperclip
-from functools import wraps
-from typing import Any, Callable
 
-
-def aoc_answer_display(func: Callable[..., Any]) -> Callable[..., Any]:
-    """
-    A decorator that displays the return value of a function using IPython.display if available,
-    falls back to print if not. Also copies the result to clipboard.
-
-    Parameters
-    ----------
-    func : Callable
-        The function whose return value should be displayed
-
-    Returns
-    -------
-    Callable
-        Wrapped function that displays and returns its result
-
-    Examples
-    --------
-    >>> @aoc_answer_display
-    ... def solve_day_1(input_data):
-    ...     return "Answer: 42"
-    >>> result = solve_day_1("some input")
-    Answer: 42
-    """
-
-    @wraps(func)
-    def wrapper(*args, **kwargs) -> Any:
-        result = func(*args, **kwargs)
-
-        try:
-            from IPython.display import display
-
-            pyperclip.copy(str(result))
-            display(result)
-        except ImportError:
-            pyperclip.copy(str(result))
-            print(result)
-
-        return result
-
-    return wrapper
+# The input loader and the answer sinks live in the repository root's
+# aoc_utils, so there is one cache and one sink registry however a 2015 script
+# is started. Make it importable when the script runs from its own directory.
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)
+
+from aoc_utils import (  # noqa: E402
+    AOC_ANSWER_SINKS,
+    AOC_INPUT_CACHE_SIZE,
+    AnswerSink,
+    AocInput,
+    aoc_answer_display,
+    aoc_answer_sink,
+    aoc_collected_answers,
+    aoc_load_input,
+    aoc_open_input,
+    aoc_register_answer_sink,
+)
 
 
 def aoc_filter_valid_coordinates(
@@ -137,20 +114,3 @@ def aoc_grid(test_string: str) -> dict:
         for i, row in enumerate(test_string.splitlines())
         for j, x in enumerate(row)
     }
-
-
-def aoc_open_input(filename: str) -> str:
-    """
-    Opens and reads the contents of a file.
-
-    Parameters
-    ----------
-    filename : str
-        The name of the file to be opened.
-
-    Returns
-    -------
-    str
-        The contents of the file as a string.
-    """
-    return open(filename, encoding="utf-8").read()
@@ -43,6 +43,9 @@ input_01 = aoc_open_input("input_01.txt")
 
 
 # %%
+from bisect import bisect_left
+
+
 def parse_instructions(input_str: str):
     return [[i[0], int(i[1:])] for i in input_str.split(", ")]
 
@@ -83,6 +86,112 @@ def part1(input_str: str) -> int:
 
 
 # %%
+def walk_segments(input_str: str) -> list[tuple[int, int, int, int]]:
+    """
+    The walk as axis-aligned segments ``(x1, y1, x2, y2)``, in walking order.
+
+    Each segment runs from the first block entered after a turn to the block
+    where the walk turns again, so it leaves out the corner it started from.
+    The starting block is the first, single point segment. That way every
+    block visited is covered exactly once unless it's visited twice, and
+    consecutive segments never share a point. Zero length moves are dropped.
+    """
+    direction = 0
+    x, y = 0, 0
+    segments = [(0, 0, 0, 0)]
+
+    for turn, steps in parse_instructions(input_str):
+        direction = (direction + (1 if turn == "R" else -1)) % len(COMPASS)
+        if not steps:
+            continue
+        dx, dy = COMPASS[direction]
+        segments.append((x + dx, y + dy, x + dx * steps, y + dy * steps))
+        x, y = x + dx * steps, y + dy * steps
+    return segments
+
+
+def segments_cross(segments: list[tuple[int, int, int, int]]) -> bool:
+    """
+    Whether any two of the segments share a block.
+
+    A sweep from west to east: horizontal segments (and single points) are
+    active between their two ends, kept as a sorted list of their rows, and
+    each vertical segment checks for an active row within its span. Two
+    active horizontals on the same row, or overlapping verticals in the same
+    column, are a crossing too. O(n log n) apart from the list inserts.
+    """
+    events = []
+    for x1, y1, x2, y2 in segments:
+        if y1 == y2:
+            events.append((min(x1, x2), 0, y1, y1))
+            events.append((max(x1, x2), 2, y1, y1))
+        else:
+            events.append((x1, 1, min(y1, y2), max(y1, y2)))
+    # At the same x, insertions come before queries before removals, so
+    # segments that only touch are caught. Verticals in one column arrive
+    # sorted by their lower end.
+    events.sort()
+
+    active: list[int] = []
+    column, reach = None, None
+    for x, kind, low, high in events:
+        i = bisect_left(active, low)
+        if kind == 0:
+            if i < len(active) and active[i] == low:
+                return True
+            active.insert(i, low)
+        elif kind == 1:
+            if column == x and low <= reach:
+                return True
+            column, reach = x, high if column != x else max(reach, high)
+            if i < len(active) and active[i] <= high:
+                return True
+        else:
+            active.pop(i)
+    return False
+
+
+def first_revisit(
+    segments: list[tuple[int, int, int, int]],
+) -> tuple[int, int] | None:
+    """
+    The first block visited twice, or None if there isn't one.
+
+    Finds the shortest prefix of the walk that crosses itself with
+    `segments_cross`, doubling the prefix until it crosses and then binary
+    searching, so an early revisit never sweeps the whole walk. Then picks
+    the earliest block of that prefix's last segment lying on any of the
+    segments before it.
+    """
+    lo, hi = 1, 2
+    while not segments_cross(segments[:hi]):
+        if hi >= len(segments):
+            return None
+        lo, hi = hi + 1, min(2 * hi, len(segments))
+
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if segments_cross(segments[:mid]):
+            hi = mid
+        else:
+            lo = mid + 1
+
+    x1, y1, x2, y2 = segments[lo - 1]
+    dx, dy = (x2 > x1) - (x2 < x1), (y2 > y1) - (y2 < y1)
+    first = None
+    for a1, b1, a2, b2 in segments[: lo - 1]:
+        low_x, high_x = max(min(x1, x2), min(a1, a2)), min(max(x1, x2), max(a1, a2))
+        low_y, high_y = max(min(y1, y2), min(b1, b2)), min(max(y1, y2), max(b1, b2))
+        if low_x > high_x or low_y > high_y:
+            continue
+        # Of the shared stretch, the end closest to where the segment starts.
+        point = (high_x if dx < 0 else low_x, high_y if dy < 0 else low_y)
+        steps = abs(point[0] - x1) + abs(point[1] - y1)
+        if first is None or steps < first[0]:
+            first = (steps, point)
+    return first[1]
+
+
 def part2(input_str: str) -> int:
     """
     Calculate the distance to the first location visited twice.
@@ -93,6 +202,10 @@ def part2(input_str: str) -> int:
     instructions consist of turns and steps, which dictate how the position
     changes on the grid.
 
+    The walk is traced as segments rather than block by block (see
+    `first_revisit`), so the run time depends on the number of instructions
+    and not on how far they go.
+
     Parameters
     ----------
     input_str : str
@@ -107,22 +220,9 @@ def part2(input_str: str) -> int:
         The Manhattan distance from the starting position to the first
         location that is visited twice.
     """
-    direction = 0
-    current_position = (0, 0)
-
-    points_visited = {current_position}
-
-    for turn, steps in parse_instructions(input_str):
-        direction = (direction + (1 if turn == "R" else -1)) % len(COMPASS)
-
-        for _ in range(steps):
-            dx, dy = COMPASS[direction]
-            current_position = (current_position[0] + dx, current_position[1] + dy)
-
-            if current_position in points_visited:
-                return abs(current_position[0]) + abs(current_position[1])
-
-            points_visited.add(current_position)
+    point = first_revisit(walk_segments(input_str))
+    if point is not None:
+        return abs(point[0]) + abs(point[1])
 
 
 # %%
@@ -49,15 +49,112 @@
 # desk. What is the **bathroom code**?
 
 # %%
-import numpy as np
-
 example = "ULL\nRRDDD\nLURDL\nUUUUD"
 
 input_02 = aoc_open_input("input_02.txt")
 
+SQUARE_KEYPAD = """
+1 2 3
+4 5 6
+7 8 9
+"""
+
+DIAMOND_KEYPAD = """
+    1
+  2 3 4
+5 6 7 8 9
+  A B C
+    D
+"""
+
+
+class Keypad:
+    """
+    A keypad layout compiled into one next-button table per direction.
+
+    Buttons are numbered in reading order and each direction becomes a
+    256-byte `bytes.translate` table that maps a button number to the button
+    reached by that move, or back to itself at an edge. Following a line of
+    instructions is then a single table lookup per character, and a whole
+    line can be composed into one button -> button map with
+    `bytes.translate`.
+
+    Parameters
+    ----------
+    layout : str
+        The keypad as drawn in the puzzle, one character per button with
+        buttons two columns apart and spaces where there is no button.
+
+    Examples
+    --------
+    >>> Keypad(SQUARE_KEYPAD).code("ULL\\nRRDDD\\nLURDL\\nUUUUD")
+    '1985'
+    """
 
-def sum_tuples(a: tuple[int, int], b: tuple[int, int]) -> tuple[int, int]:
-    return tuple(sum(_) for _ in zip(a, b))
+    def __init__(self, layout: str) -> None:
+        positions = {
+            (row, column): label
+            for row, line in enumerate(layout.strip("\n").splitlines())
+            for column, label in enumerate(line)
+            if not label.isspace()
+        }
+        self.labels = "".join(positions.values())
+        number = {position: i for i, position in enumerate(positions)}
+        self.identity = bytes(range(len(self.labels)))
+
+        # moves[byte of "U"] is the table for "U"; every other byte is unused
+        self.moves: list[bytes | None] = [None] * 256
+        for direction, (dr, dc) in zip("UDLR", ((-1, 0), (1, 0), (0, -2), (0, 2))):
+            table = bytearray(range(256))
+            for (row, column), i in number.items():
+                table[i] = number.get((row + dr, column + dc), i)
+            self.moves[ord(direction)] = bytes(table)
+
+    def button(self, label: str) -> int:
+        """The number of the button labelled `label`."""
+        return self.labels.index(label)
+
+    def follow(self, start: int, line: str) -> int:
+        """The button reached from button `start` by following `line`."""
+        moves = self.moves
+        position = start
+        for move in line.encode():
+            position = moves[move][position]
+        return position
+
+    def line_map(self, line: str) -> bytes:
+        """
+        Compose `line` into one map: ``line_map(line)[start]`` is
+        ``follow(start, line)`` for every button.
+        """
+        moves = self.moves
+        mapping = self.identity
+        for move in line.encode():
+            mapping = mapping.translate(moves[move])
+        return mapping
+
+    def code(self, instructions: str, start: str = "5", compose: bool = False) -> str:
+        """
+        The code pressed by following each line of `instructions` from the
+        previous button, starting on the button labelled `start`.
+
+        With `compose`, each distinct line is turned into a `line_map` once,
+        which pays off when the same lines repeat.
+        """
+        position = self.button(start)
+        pressed = []
+        if compose:
+            line_maps: dict[str, bytes] = {}
+            for line in instructions.splitlines():
+                if line not in line_maps:
+                    line_maps[line] = self.line_map(line)
+                position = line_maps[line][position]
+                pressed.append(position)
+        else:
+            for line in instructions.splitlines():
+                position = self.follow(position, line)
+                pressed.append(position)
+        return "".join(self.labels[i] for i in pressed)
 
 
 def part_one(input_str: str) -> str:
@@ -82,28 +179,7 @@ def part_one(input_str: str) -> str:
         The bathroom code generated by the sequence of movements on the keypad.
     """
 
-    def pos_check_exists(position: tuple[int, int]) -> bool:
-        keypad_range = range(3)
-        a, b = position
-        return a in keypad_range and b in keypad_range
-
-    key = {"U": (-1, 0), "D": (1, 0), "L": (0, -1), "R": (0, 1)}
-
-    keypad = np.array([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
-
-    start_pos = (1, 1)
-
-    code = ""
-    pos = start_pos
-    for line in input_str.splitlines():
-        for char in line:
-            proposed_pos = sum_tuples(pos, key[char])
-            pos = proposed_pos if pos_check_exists(proposed_pos) else pos
-            digit = keypad[pos]
-        code += str(digit)
-
-    # print(code)
-    return code
+    return Keypad(SQUARE_KEYPAD).code(input_str)
 
 
 # %%
@@ -153,7 +229,7 @@ def part_two(input_str: str) -> str:
 
     This function processes a series of directional instructions to navigate a
     keypad and generates a code based on the digits corresponding to the final
-    positions after following the instructions. The keypad is a 3x3 grid of
+    positions after following the instructions. The keypad is a diamond of
     numbers, and the movement is constrained to the grid.
 
 
@@ -169,42 +245,7 @@ def part_two(input_str: str) -> str:
         The bathroom code generated by the sequence of movements on the keypad.
     """
 
-    directions = {
-        "U": np.array([-1, 0]),
-        "D": np.array([1, 0]),
-        "L": np.array([0, -1]),
-        "R": np.array([0, 1]),
-    }
-
-    keypad = np.array(
-        [
-            [np.nan, np.nan, 1, np.nan, np.nan],
-            [np.nan, 2, 3, 4, np.nan],
-            [5, 6, 7, 8, 9],
-            [np.nan, "A", "B", "C", np.nan],
-            [np.nan, np.nan, "D", np.nan, np.nan],
-        ]
-    )
-
-    start_pos = np.argwhere(keypad == "5")[0]
-
-    def pos_check_exists(position: np.ndarray) -> bool:
-        return (
-            np.sum((np.argwhere(keypad != "nan")[:, None] == position).all(2).any(1))
-            == 1
-        )
-
-    code = ""
-    pos = start_pos
-    for line in input_str.splitlines():
-        for char in line:
-            proposed_pos = pos + directions[char]
-            pos = proposed_pos if pos_check_exists(proposed_pos) else pos
-            a, b = pos
-            digit = keypad[a, b]
-        code += str(digit)
-
-    return code
+    return Keypad(DIAMOND_KEYPAD).code(input_str)
 
 
 # %%
@@ -254,7 +295,6 @@ def part_two_sourcery(input_str: str) -> str:
     for line in input_str.splitlines():
         for char in line:
             proposed_pos = (pos[0] + key[char][0], pos[1] + key[char][1])
-            # proposed_pos = sum_tuples(pos, key[char])
             if pos_check_exists(proposed_pos):
                 pos = proposed_pos
             a, b = pos
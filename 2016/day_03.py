@@ -19,23 +19,35 @@
 # In your puzzle input, **how many** of the listed triangles are **possible**?
 
 # %%
+import numpy as np
+
 input_03 = aoc_open_input("input_03.txt")
 
 
 # %%
-def valid_triangle(triangle: list[int]) -> bool:
-    a, b, c = triangle
-    return a + b > c and b + c > a and c + a > b
+def input_str_to_array(input_str: str) -> np.ndarray:
+    """
+    Parse the side lengths straight into an ``(n, 3)`` array, one triangle
+    per row, without building a Python list per line.
+    """
+    return np.fromstring(input_str, dtype=np.int32, sep=" ").reshape(-1, 3)
 
 
 # %%
-def input_str_to_array(input_str: str) -> list[list[int]]:
-    return [list(map(int, row.split())) for row in input_str.splitlines()]
+def count_valid_triangles(triangles: np.ndarray) -> int:
+    """
+    Count the rows of `triangles` that are possible triangles.
+
+    Once each row is sorted a triangle is possible exactly when the two short
+    sides add up to more than the longest one.
+    """
+    sides = np.sort(triangles, axis=1)
+    return int(np.count_nonzero(sides[:, 0] + sides[:, 1] > sides[:, 2]))
 
 
 # %%
 def part_one(input_str: str) -> int:
-    return sum(valid_triangle(l) for l in input_str_to_array(input_str))
+    return count_valid_triangles(input_str_to_array(input_str))
 
 
 # %%
@@ -63,9 +75,6 @@ aoc_answer_display(part_one(input_03))
 # In your puzzle input, and instead reading by columns, **how many** of the
 # listed triangles are **possible**?
 
-# %%
-import itertools
-
 # %%
 example_02 = """101 301 501
 102 302 502
@@ -76,36 +85,14 @@ example_02 = """101 301 501
 
 
 # %%
-def batched(iterable, n):
-    # batched('ABCDEFG', 3) → ABC DEF G
-    if n < 1:
-        raise ValueError("n must be at least one")
-    iterator = iter(iterable)
-    while batch := tuple(itertools.islice(iterator, n)):
-        yield batch
-
-
-# %%
-def aoc_transpose_list_of_lists(input_list: list[list]) -> list[list]:
+def part_two(input_str: str) -> int:
     """
-    Parameters
-    ----------
-    input_list : list[list[Any]]
-
-    Returns
-    -------
-    list
+    Every block of three rows holds three triangles, one per column, so
+    swapping the last two axes of the ``(blocks, 3, 3)`` view lines them up as
+    rows again.
     """
-    return list(map(lambda *x: list(x), *(input_list)))
-
-
-# %%
-def part_two(input_str: str) -> int:
-    return sum(
-        valid_triangle(item)
-        for column in aoc_transpose_list_of_lists(input_str_to_array(input_str))
-        for item in batched(column, 3)
-    )
+    triangles = input_str_to_array(input_str).reshape(-1, 3, 3).swapaxes(1, 2)
+    return count_valid_triangles(triangles.reshape(-1, 3))
 
 
 # %%
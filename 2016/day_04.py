@@ -26,7 +26,9 @@
 
 # %%
 import re
-from collections import Counter
+from functools import cache
+from string import ascii_lowercase
+from typing import Iterator
 
 # %%
 examples = """aaaaa-bbb-z-y-x-123[abxyz]
@@ -38,31 +40,46 @@ input_04 = aoc_open_input("input_04.txt")
 
 
 # %%
-def generate_checksum(input_room: str) -> str:
-    counter_elements = Counter(re.findall(r"[A-Za-z]", input_room.split("[")[0]))
-    sorted_by_value_then_key = dict(
-        sorted(counter_elements.items(), key=lambda x: (-x[1], x[0]))
-    )
-    return "".join(sorted_by_value_then_key.keys())[:5]
+ROOM = re.compile(r"^([a-z-]+)-(\d+)(?:\[([a-z]+)\])?$", re.MULTILINE)
 
 
-# %%
-def extract_checksum(input_room: str) -> str:
-    return re.findall(r"(?:\[)(\w+)(?:\])", input_room)[0]
+def parse_rooms(input_str: str) -> Iterator[tuple[str, int, str | None]]:
+    """
+    Yield the encrypted name, sector ID and checksum of every room in a single
+    scan of `input_str`. The checksum is `None` when a line has none.
+    """
+    for name, sector_id, checksum in ROOM.findall(input_str):
+        yield name, int(sector_id), checksum or None
 
 
 # %%
-def extract_sector_id(input_room: str) -> int:
-    return int(re.findall(r"\d+", input_room)[0])
+def generate_checksum(name: str) -> str:
+    """
+    The five most common letters of `name`, ties broken alphabetically.
+
+    Letters are dropped into one bucket per count while walking the alphabet,
+    so each bucket is already in alphabetical order and reading the buckets
+    from the highest count down needs no sort.
+    """
+    buckets = [""] * (len(name) + 1)
+    for letter in ascii_lowercase:
+        count = name.count(letter)
+        if count:
+            buckets[count] += letter
+    checksum = ""
+    for letters in reversed(buckets):
+        checksum += letters
+        if len(checksum) >= 5:
+            break
+    return checksum[:5]
 
 
 # %%
 def part_one(input_str: str) -> int:
-    splitted = input_str.splitlines()
     return sum(
-        extract_sector_id(x)
-        for x in splitted
-        if generate_checksum(x) == extract_checksum(x)
+        sector_id
+        for name, sector_id, checksum in parse_rooms(input_str)
+        if generate_checksum(name) == checksum
     )
 
 
@@ -97,25 +114,32 @@ aoc_answer_display(part_one(input_04))
 example_02 = "qzmt-zixmtkozy-ivhz-343"
 
 
+# %%
+@cache
+def shift_table(shift: int) -> dict[int, int]:
+    """`str.translate` table rotating letters `shift` places and dashes to spaces."""
+    shift %= 26
+    rotated = ascii_lowercase[shift:] + ascii_lowercase[:shift]
+    return str.maketrans(ascii_lowercase + "-", rotated + " ")
+
+
 # %%
 def decrypt_row(input_row: str) -> tuple[str, int]:
     """
     Decrypts a given row string by shifting each letter forward in the alphabet
-    based on the sector ID. The sector ID is extracted from the input string,
-    and the shift is calculated as the sector ID modulo 26. Hyphens in the input
-    are converted to spaces in the output.
+    based on the sector ID. Hyphens in the name are converted to spaces and an
+    optional trailing checksum is ignored.
 
     Parameters
     ----------
     input_row : str
-        A string containing encrypted text and a sector ID. The sector ID is
-        assumed to be the numeric part of the string, and the rest of the string
-        is the encrypted text.
+        A string containing an encrypted name followed by a dash and a sector
+        ID, optionally followed by a ``[checksum]``.
 
     Returns
     -------
     tuple[str, int]
-        A tuple where the first element is the decrypted string (with letters
+        A tuple where the first element is the decrypted name (with letters
         shifted according to the sector ID and hyphens replaced by spaces), and
         the second element is the sector ID extracted from the input string.
 
@@ -124,16 +148,8 @@ def decrypt_row(input_row: str) -> tuple[str, int]:
     >>> decrypt_row("qzmt-zixmtkozy-ivhz-343")
     ('very encrypted name', 343)
     """
-    sector_id = extract_sector_id(input_row)
-    offset = sector_id % 26
-
-    decrypted = "".join(
-        " " if letter == "-" else chr((ord(letter) - ord("a") + offset) % 26 + ord("a"))
-        for letter in input_row
-        if not letter.isdigit()
-    )
-
-    return decrypted.strip(), sector_id
+    name, sector_id, _ = next(parse_rooms(input_row))
+    return name.translate(shift_table(sector_id % 26)), sector_id
 
 
 # %%
@@ -144,9 +160,9 @@ decrypt_row(example_02)
 def part_two(input_str: str = input_04, verbose: bool = False) -> int:
     """
     Processes a string of encrypted rows to find the one that, when decrypted,
-    contains the word "pole". The function decrypts each row using the
-    `decrypt_row` function and checks if the word "pole" is present in the
-    decrypted string. If found, it returns the corresponding sector ID.
+    contains the word "pole". The function decrypts each row with the cached
+    `shift_table` for its sector ID and checks if the word "pole" is present in
+    the decrypted string. If found, it returns the corresponding sector ID.
 
     Parameters
     ----------
@@ -161,11 +177,11 @@ def part_two(input_str: str = input_04, verbose: bool = False) -> int:
         The sector ID of the row whose decrypted name contains the word "pole".
         If no such row is found, the function returns `None`.
     """
-    for line in input_str.splitlines():
-        real_name, sector_id = decrypt_row(line)
+    for name, sector_id, _ in parse_rooms(input_str):
+        real_name = name.translate(shift_table(sector_id % 26))
         if "pole" in real_name:
             if verbose:
-                print(line, real_name)
+                print(name, real_name)
             return sector_id
 
 
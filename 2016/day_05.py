@@ -34,7 +34,6 @@
 
 # %%
 import contextlib
-import hashlib
 
 input_05 = "reyedfim"
 example = "abc"
@@ -80,18 +79,16 @@ example_answer = "18f47a30"
 def solve(data: str):
     part1 = ""
     part2 = ["_"] * 8
-    index = 0
-    while "_" in part2:
-        h = hashlib.md5(f"{data}{index}".encode()).hexdigest()
-        if h.startswith("00000"):
-            if len(part1) < 8:
-                part1 += h[5]
-            with contextlib.suppress(ValueError):
-                pos = int(h[5])
-                if 0 <= pos <= 7 and part2[pos] == "_":
-                    part2[pos] = h[6]
-            print(f"\r{part1:<8} {''.join(part2)}", end="")
-        index += 1
+    for _, h in aoc_md5_nonce_search(data, 5):
+        if len(part1) < 8:
+            part1 += h[5]
+        with contextlib.suppress(ValueError):
+            pos = int(h[5])
+            if 0 <= pos <= 7 and part2[pos] == "_":
+                part2[pos] = h[6]
+        print(f"\r{part1:<8} {''.join(part2)}", end="")
+        if "_" not in part2:
+            break
     print()
     return part1, "".join(part2)
 
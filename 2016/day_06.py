@@ -39,7 +39,9 @@
 # version** of the message being sent?
 
 # %%
-from collections import Counter
+from functools import lru_cache
+
+import numpy as np
 
 # %%
 example = """eedadn
@@ -64,14 +66,40 @@ example_answer = "easter"
 input_06 = aoc_open_input("input_06.txt")
 
 
+# %%
+@lru_cache(maxsize=1)
+def column_histogram(input_str: str) -> np.ndarray:
+    """
+    Count every byte value in every column of the message recordings.
+
+    The input is viewed as a ``uint8`` matrix with the newlines sliced off,
+    so no per-character Python objects are made, and each column is counted
+    with `np.bincount`. The last input is cached so both parts share one
+    histogram.
+
+    Parameters
+    ----------
+    input_str : str
+        Equal length lines of lowercase letters.
+
+    Returns
+    -------
+    np.ndarray
+        A read-only ``(columns, 256)`` array, ``histogram[i, ord(c)]`` being
+        how often ``c`` appears in column ``i``.
+    """
+    data = input_str.strip("\n").encode() + b"\n"
+    width = data.index(b"\n")
+    grid = np.frombuffer(data, dtype=np.uint8).reshape(-1, width + 1)[:, :width]
+    histogram = np.stack([np.bincount(column, minlength=256) for column in grid.T])
+    histogram.setflags(write=False)
+    return histogram
+
+
 # %%
 def part_one(input_str: str) -> str:
-    return "".join(
-        Counter(column).most_common(1)[0][0]
-        for column in aoc_transpose_list_of_lists(
-            [list(row) for row in input_str.splitlines()]
-        )
-    )
+    most_common = column_histogram(input_str).argmax(axis=1)
+    return most_common.astype(np.uint8).tobytes().decode()
 
 
 # %%
@@ -103,12 +131,11 @@ aoc_answer_display(part_one(input_06))
 
 # %%
 def part_two(input_str: str) -> str:
-    return "".join(
-        Counter(column).most_common()[-1][0][0]
-        for column in aoc_transpose_list_of_lists(
-            [list(row) for row in input_str.splitlines()]
-        )
-    )
+    histogram = column_histogram(input_str)
+    # letters that never appear in a column are not candidates
+    absent = np.iinfo(histogram.dtype).max
+    least_common = np.where(histogram, histogram, absent).argmin(axis=1)
+    return least_common.astype(np.uint8).tobytes().decode()
 
 
 # %%
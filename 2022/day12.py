@@ -59,7 +59,7 @@
 # %%
 from collections import deque
 
-from utils import open_input
+from utils import AocGrid, open_input
 
 test = """Sabqponm
 abcryxxl accszExk acctuvwj abdefghi"""
@@ -79,6 +79,7 @@ input_12 = open_input("input_12.txt")
 #          - Right: `(0, 1)`
 # 2. Keep track of count and visited squares
 
+
 # %%
 def adj(i, j):
     return (i - 1, j), (i + 1, j), (i, j - 1), (i, j + 1)
@@ -86,12 +87,10 @@ def adj(i, j):
 
 # %%
 def p1(f):
-    grid: dict[tuple[int, int], str] = {
-        (i, j): x for i, row in enumerate(f.splitlines()) for j, x in enumerate(row)
-    }
+    grid = AocGrid(f)
 
-    start = next(k for k, v in grid.items() if v == "S")
-    end = next(k for k, v in grid.items() if v == "E")
+    start = tuple(grid.find("S")[0].tolist())
+    end = tuple(grid.find("E")[0].tolist())
 
     # print(start) print(end)
 
@@ -123,10 +122,8 @@ abcryxxl accszExk acctuvwj abdefghi"""
 
 
 # %%
-def grid(f: str) -> dict[tuple[int, int], str]:
-    return {
-        (i, j): x for i, row in enumerate(f.splitlines()) for j, x in enumerate(row)
-    }
+def grid(f: str) -> AocGrid:
+    return AocGrid(f)
 
 
 # %%
@@ -179,16 +176,13 @@ print(p1(input_12))
 # **What is the fewest steps required to move starting from any square with
 # elevation `a` to the location that should get the best signal?**
 
+
 # %%
 def p2(f):
-    grid: dict[tuple[int, int], str] = {
-        (i, j): "a" if x == "S" else x
-        for i, row in enumerate(f.splitlines())
-        for j, x in enumerate(row)
-    }
-
-    starts = {k for k, v in grid.items() if v == "a"}
-    end = next(k for k, v in grid.items() if v == "E")
+    grid = AocGrid(f.replace("S", "a"))
+
+    starts = set(map(tuple, grid.find("a").tolist()))
+    end = tuple(grid.find("E")[0].tolist())
     grid[end] = "z"
 
     # print(start) print(end)
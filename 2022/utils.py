@@ -1,5 +1,18 @@
+import os
+import sys
+
+# AocGrid lives in the repository root's aoc_utils; make it importable when a
+# 2022 script runs from its own directory instead of keeping a second copy.
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)
+
+from aoc_utils import AocGrid  # noqa: E402
+
+
 def open_input(filename):
-    return open(filename, encoding="utf-8").read()
+    with open(filename, encoding="utf-8") as file:
+        return file.read()
 
 
 def nxn_array(dimensions: int) -> list[list]:
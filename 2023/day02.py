@@ -305,7 +305,7 @@ def p2(f: list[str]) -> int:
 
 
 # %%
-p1(aoc_open_input("input_02.txt").splitlines())
+p1(aoc_load_input("input_02.txt").lines)
 
 # %%
-p2(aoc_open_input("input_02.txt").splitlines())
+p2(aoc_load_input("input_02.txt").lines)
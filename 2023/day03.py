@@ -69,18 +69,20 @@ grid = aoc_grid(test)
 # grid
 
 # %%
+shape = tuple(aoc_shape(test).values())
+digit_coordinates = [pair for pair, value in grid.items() if value.isdigit()]
+neighbours, valid = aoc_adjacent_coordinates_batch(
+    np.array(digit_coordinates), shape=shape, include_diagonals=True
+)
+
 digits = [
     {
         "coordinates": pair,
-        "value": value,
-        "adjacent_coordinates": aoc_adj(
-            *pair, include_diagonals=True, only_positive_indices=True
-        ),
+        "value": grid[pair],
+        "adjacent_coordinates": list(map(tuple, adjacent[mask].tolist())),
     }
-    for pair, value in grid.items()
-    if value.isdigit()
+    for pair, adjacent, mask in zip(digit_coordinates, neighbours, valid)
 ]
-# digits
 
 # %%
 symbols = ["#", "$", "%", "&", "*", "+", "-", "/", "=", "@"]
@@ -56,7 +56,7 @@ def mull_it_over(input_str: str) -> int:
 mull_it_over(example)
 
 # %%
-print(result := mull_it_over(input_03)) or pyperclip.copy(str(result))
+aoc_answer_display(mull_it_over(input_03))
 
 # %% [markdown]
 # ## --- Part Two ---
@@ -169,60 +169,34 @@ ceres_search(input_04)
 # and try again. **How many times does an X-MAS appear**?
 
 
-# %%
-def aoc_grid(test_string: str) -> dict:
-    """
-    Create a dictionary representing a grid from a string.
-
-    Parameters
-    ----------
-    test_string : str
-        Input string representing the grid.
-
-    Returns
-    -------
-    dict
-        A dictionary where keys are tuple coordinates (i, j) and values are
-        corresponding characters from the grid.
-    """
-
-    return {
-        (i, j): x
-        for i, row in enumerate(test_string.splitlines())
-        for j, x in enumerate(row)
-        if x in {"S", "A", "M"}  # Only store relevant characters
-    }
-
-
 # %%
 @aoc_answer_display
 def x_mas_counts(input_str: str) -> int:
-    grid = aoc_grid(input_str)
+    grid = AocGrid(input_str)
     counts = 0
 
-    for key, value in grid.items():
-        if value == "A":
-            middle_row, middle_column = key
-
-            top_row = middle_row - 1
-            bottom_row = middle_row + 1
-
-            left_col = middle_column - 1
-            right_col = middle_column + 1
-
-            with contextlib.suppress(KeyError):
-                diagonal1 = (
-                    f"{grid[top_row, left_col]}"
-                    f"{grid[middle_row, middle_column]}"
-                    f"{grid[bottom_row, right_col]}"
-                )
-                diagonal2 = (
-                    f"{grid[top_row, right_col]}"
-                    f"{grid[middle_row, middle_column]}"
-                    f"{grid[bottom_row, left_col]}"
-                )
-                if (diagonal1 in ["SAM", "MAS"]) and (diagonal2 in ["SAM", "MAS"]):
-                    counts += 1
+    for key in grid.find("A").tolist():
+        middle_row, middle_column = key
+
+        top_row = middle_row - 1
+        bottom_row = middle_row + 1
+
+        left_col = middle_column - 1
+        right_col = middle_column + 1
+
+        with contextlib.suppress(KeyError):
+            diagonal1 = (
+                f"{grid[top_row, left_col]}"
+                f"{grid[middle_row, middle_column]}"
+                f"{grid[bottom_row, right_col]}"
+            )
+            diagonal2 = (
+                f"{grid[top_row, right_col]}"
+                f"{grid[middle_row, middle_column]}"
+                f"{grid[bottom_row, left_col]}"
+            )
+            if (diagonal1 in ["SAM", "MAS"]) and (diagonal2 in ["SAM", "MAS"]):
+                counts += 1
     return counts
 
 
@@ -1,11 +1,38 @@
 # from collections import deque
-from functools import wraps
-from itertools import product
-from typing import Any, Callable
-from markdownify import markdownify as md
-import requests
-import numpy as np
-import pyperclip
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+import mmap
+import os
+import re
+import sys
+from collections.abc import MutableMapping
+from functools import cache, cached_property, wraps
+from itertools import count, product
+from types import ModuleType
+from typing import Any, Callable, Iterator
+
+
+class _LazyModule(ModuleType):
+    """
+    Stand-in for a module that is only imported on first attribute access.
+
+    This file is loaded into every IPython session and by every solution
+    script, so numpy, requests and pyperclip are bound to their usual names
+    without paying for the import until something actually uses them.
+    """
+
+    def __getattr__(self, attr: str) -> Any:
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+
+np = _LazyModule("numpy")
+pyperclip = _LazyModule("pyperclip")
+requests = _LazyModule("requests")
 
 
 def aoc_open_input(filename: str) -> str:
@@ -28,11 +55,178 @@ def aoc_open_input(filename: str) -> str:
     IOError
         For other I/O related errors.
     """
-    try:
-        with open(filename, encoding="utf-8") as file:
-            return file.read()
-    except (FileNotFoundError, PermissionError, IOError) as e:
-        raise e
+    # A plain read: the string belongs to the caller and nothing is kept
+    # alive in the `aoc_load_input` cache.
+    with open(filename, encoding="utf-8") as file:
+        return file.read()
+
+
+class AocInput:
+    """
+    A puzzle input mapped into memory, with every parse cached on the object.
+
+    The file is memory-mapped instead of read, so the raw bytes are shared
+    with the page cache rather than copied. Decoded text, the line index and
+    the typed views below are built on first use and kept, and `aoc_load_input`
+    hands out the same object for the same unchanged file, so part one and
+    part two never split the input twice. Only the most recently loaded
+    files stay cached.
+
+    Parameters
+    ----------
+    filename : str
+        The name of the file to be mapped.
+
+    Attributes
+    ----------
+    data : memoryview
+        Read-only view of the raw bytes.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as file:
+    ...     _ = file.write("1 2\\n3 -4\\n\\n5 6\\n")
+    >>> puzzle = aoc_load_input(file.name)
+    >>> puzzle.lines
+    ('1 2', '3 -4', '', '5 6')
+    >>> puzzle.line(1)
+    '3 -4'
+    >>> puzzle.blocks
+    (('1 2', '3 -4'), ('5 6',))
+    >>> puzzle.ints.tolist()
+    [1, 2, 3, -4, 5, 6]
+    >>> os.remove(file.name)
+    """
+
+    def __init__(self, filename: str) -> None:
+        self.filename = filename
+        with open(filename, "rb") as file:
+            if os.fstat(file.fileno()).st_size:
+                self._buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self._buffer = b""
+        self.data = memoryview(self._buffer)
+
+    def __len__(self) -> int:
+        return len(self.line_offsets) - 1
+
+    @cached_property
+    def array(self) -> np.ndarray:
+        """``uint8`` view of the raw bytes."""
+        return np.frombuffer(self.data, dtype=np.uint8)
+
+    @cached_property
+    def text(self) -> str:
+        return str(self.data, encoding="utf-8")
+
+    @cached_property
+    def line_offsets(self) -> np.ndarray:
+        """
+        Start offset of every line followed by the end of the last line, so
+        line ``i`` is ``data[offsets[i]:offsets[i + 1] - 1]`` whether or not the
+        file ends with a newline.
+        """
+        newlines = np.flatnonzero(self.array == ord("\n"))
+        end = len(self.array)
+        if end and (not len(newlines) or newlines[-1] != end - 1):
+            newlines = np.append(newlines, end)
+        return np.concatenate(([0], newlines + 1))
+
+    def line(self, i: int) -> str:
+        """Decode a single line without splitting the rest of the file."""
+        start, end = self.line_offsets[i], self.line_offsets[i + 1] - 1
+        return str(self.data[start:end], encoding="utf-8").rstrip("\r")
+
+    @cached_property
+    def lines(self) -> tuple[str, ...]:
+        return tuple(self.text.splitlines())
+
+    @cached_property
+    def blocks(self) -> tuple[tuple[str, ...], ...]:
+        """Groups of lines separated by blank lines."""
+        return tuple(
+            tuple(block.splitlines())
+            for block in re.split(r"\n\s*\n", self.text.strip("\n"))
+            if block
+        )
+
+    @cached_property
+    def ints(self) -> np.ndarray:
+        """Every (optionally negative) integer in the file, in order."""
+        return np.array(
+            [int(number) for number in re.findall(rb"-?\d+", self.data)],
+            dtype=np.int64,
+        )
+
+    @cached_property
+    def grid(self) -> np.ndarray:
+        """
+        The input as a ``(rows, columns)`` array of ``uint8`` characters.
+
+        For a rectangular grid this is a zero-copy view that strides over the
+        newlines; ragged lines fall back to `AocGrid` padding with spaces.
+        """
+        lengths = np.diff(self.line_offsets) - 1
+        if len(lengths) and (lengths == lengths[0]).all():
+            return np.lib.stride_tricks.as_strided(
+                self.array,
+                shape=(len(lengths), lengths[0]),
+                strides=(lengths[0] + 1, 1),
+                writeable=False,
+            )
+        return AocGrid(self.text, pad=0).data
+
+    def __repr__(self) -> str:
+        return f"AocInput({self.filename!r}, lines={len(self)})"
+
+
+AOC_INPUT_CACHE_SIZE = 4
+
+# Real path -> ((mtime_ns, size), input), least recently used first.
+_AOC_INPUTS: dict[str, tuple[tuple[int, int], AocInput]] = {}
+
+
+def aoc_load_input(filename: str) -> AocInput:
+    """
+    Memory-map a puzzle input, reusing the cached `AocInput` while the file
+    is unchanged.
+
+    An edited file replaces its old entry, and only the
+    `AOC_INPUT_CACHE_SIZE` most recently loaded files are kept, so a long
+    session doesn't hold on to every input and parse it has ever seen.
+
+    Parameters
+    ----------
+    filename : str
+        The name of the file to be opened.
+
+    Returns
+    -------
+    AocInput
+        The mapped input and its cached parses.
+    """
+    stat = os.stat(filename)
+    path = os.path.realpath(filename)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached_stamp, puzzle = _AOC_INPUTS.pop(path, (None, None))
+    if cached_stamp != stamp:
+        puzzle = AocInput(filename)
+    # Reinserting moves the path to the most recently used end.
+    _AOC_INPUTS[path] = (stamp, puzzle)
+    while len(_AOC_INPUTS) > AOC_INPUT_CACHE_SIZE:
+        del _AOC_INPUTS[next(iter(_AOC_INPUTS))]
+    return puzzle
+
+
+@cache
+def _adjacent_offsets() -> np.ndarray:
+    # Row and column offsets to the up, down, left and right neighbours,
+    # followed by the upper-left, upper-right, lower-left and lower-right
+    # diagonals.
+    return np.array(
+        [[-1, 0], [1, 0], [0, -1], [0, 1], [-1, -1], [-1, 1], [1, -1], [1, 1]]
+    )
 
 
 def aoc_adjacent_coordinates(
@@ -64,15 +258,8 @@ def aoc_adjacent_coordinates(
         down, left, and right coordinates. If only_positive_indices is True, it
         filters out negative row and column indices.
     """
-    # Generate coordinates using meshgrid
-    row_offsets = np.array([-1, 1, 0, 0])
-    col_offsets = np.array([0, 0, -1, 1])
-
-    if include_diagonals:
-        row_offsets = np.concatenate([row_offsets, [-1, -1, 1, 1]])
-        col_offsets = np.concatenate([col_offsets, [-1, 1, -1, 1]])
-
-    adjacent_coordinates = np.column_stack((i + row_offsets, j + col_offsets))
+    offsets = _adjacent_offsets() if include_diagonals else _adjacent_offsets()[:4]
+    adjacent_coordinates = offsets + (i, j)
 
     if only_positive_indices:
         # Filter out negative indices
@@ -82,6 +269,75 @@ def aoc_adjacent_coordinates(
     return adjacent_coordinates
 
 
+def aoc_adjacent_coordinates_batch(
+    coordinates: np.ndarray | None = None,
+    shape: tuple[int, int] | None = None,
+    include_diagonals: bool = False,
+    wrap: bool = False,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Get the adjacent coordinates of many positions at once.
+
+    Batched counterpart of `aoc_adjacent_coordinates`: a single broadcast add
+    replaces one set of NumPy allocations per cell.
+
+    Parameters
+    ----------
+    coordinates : np.ndarray | None, optional
+        Array of shape (N, 2) with row and column indices. When omitted, every
+        cell of a grid of the given `shape` is used, in row-major order.
+    shape : tuple[int, int] | None, optional
+        Number of rows and columns of the grid. Required when `coordinates`
+        or `wrap` is not given, by default None.
+    include_diagonals : bool, optional
+        Flag indicating whether to include diagonal coordinates (8-connectivity)
+        instead of only up, down, left and right (4-connectivity), by default
+        False.
+    wrap : bool, optional
+        Flag indicating whether neighbours wrap around the edges of the grid
+        like a torus, by default False.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        An array of shape (N, k, 2) with the k adjacent coordinates of every
+        position, in the same order as `aoc_adjacent_coordinates`, and a
+        boolean mask of shape (N, k) flagging the neighbours that lie inside
+        the grid. Without a `shape` only negative indices are flagged as
+        invalid.
+
+    Examples
+    --------
+    >>> neighbours, valid = aoc_adjacent_coordinates_batch(
+    ...     np.array([[0, 0], [1, 1]]), shape=(2, 2)
+    ... )
+    >>> neighbours[valid]
+    array([[1, 0],
+           [0, 1],
+           [0, 1],
+           [1, 0]])
+    """
+    if coordinates is None:
+        if shape is None:
+            raise ValueError("Either coordinates or shape must be given")
+        coordinates = np.indices(shape).reshape(2, -1).T
+    if wrap and shape is None:
+        raise ValueError("wrap=True requires the grid shape")
+
+    offsets = _adjacent_offsets() if include_diagonals else _adjacent_offsets()[:4]
+    neighbours = np.asarray(coordinates)[:, None, :] + offsets
+
+    if wrap:
+        neighbours %= shape
+        return neighbours, np.ones(neighbours.shape[:2], dtype=bool)
+
+    valid = (neighbours >= 0).all(axis=2)
+    if shape is not None:
+        valid &= (neighbours < shape).all(axis=2)
+
+    return neighbours, valid
+
+
 def aoc_grid(test_string: str) -> dict:
     """
     Create a dictionary representing a grid from a string.
@@ -105,6 +361,162 @@ def aoc_grid(test_string: str) -> dict:
     }
 
 
+class AocGrid(MutableMapping):
+    """
+    A character grid stored in a flat ``bytearray`` with a padded border.
+
+    The bytes are exposed as a NumPy ``uint8`` view for vectorised work, while
+    the object also behaves like the ``{(i, j): char}`` dictionary returned by
+    `aoc_grid`, so existing solutions can swap it in without rewrites. Cells
+    that fall outside of the grid raise ``KeyError`` just like the dictionary
+    did, and ``.get`` returns the default.
+
+    Parameters
+    ----------
+    input_str : str
+        Input string representing the grid. Ragged lines are right-padded with
+        ``fill``.
+    pad : int, optional
+        Width of the border around the grid, by default 1.
+    fill : str, optional
+        Character used for the border and for ragged lines, by default " ".
+
+    Attributes
+    ----------
+    height, width : int
+        Size of the grid without the border.
+    padded : np.ndarray
+        ``uint8`` view of the whole buffer, border included.
+    data : np.ndarray
+        ``uint8`` view of the grid without the border.
+
+    Examples
+    --------
+    >>> grid = AocGrid("ab\\ncd")
+    >>> grid[1, 0]
+    'c'
+    >>> grid.get((2, 0), "~")
+    '~'
+    >>> grid.find("d")
+    array([[1, 1]])
+    """
+
+    def __init__(self, input_str: str, pad: int = 1, fill: str = " ") -> None:
+        lines = input_str.splitlines()
+
+        self.height = len(lines)
+        self.width = max(map(len, lines), default=0)
+        self.pad = pad
+        self.fill = fill
+        self.stride = self.width + 2 * pad
+
+        self._buffer = bytearray(
+            fill.encode("latin-1") * (self.stride * (self.height + 2 * pad))
+        )
+        for i, line in enumerate(lines):
+            start = self.index(i, 0)
+            self._buffer[start : start + len(line)] = line.encode("latin-1")
+
+        self.padded = np.frombuffer(self._buffer, dtype=np.uint8).reshape(
+            self.height + 2 * pad, self.stride
+        )
+        self.data = self.padded[pad : pad + self.height, pad : pad + self.width]
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.height, self.width
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._buffer)
+
+    def index(self, i: int, j: int) -> int:
+        """
+        Flat offset of ``(i, j)`` in the buffer. Valid for every cell of the
+        border too, i.e. ``-pad <= i < height + pad``.
+        """
+        return (i + self.pad) * self.stride + j + self.pad
+
+    def coordinates(self, index: int) -> tuple[int, int]:
+        """Inverse of `index`."""
+        i, j = divmod(index, self.stride)
+        return i - self.pad, j - self.pad
+
+    def offsets(self, include_diagonals: bool = False) -> tuple[int, ...]:
+        """
+        Flat offsets to the up, down, left and right neighbours (and diagonals
+        if requested), in the same order as `aoc_adjacent_coordinates`.
+
+        Adding them to an `index` never leaves the buffer for cells inside the
+        grid, so walks over flat indices need no bounds checks.
+        """
+        result = (-self.stride, self.stride, -1, 1)
+        if include_diagonals:
+            result += (
+                -self.stride - 1,
+                -self.stride + 1,
+                self.stride - 1,
+                self.stride + 1,
+            )
+        return result
+
+    def byte(self, index: int) -> int:
+        """Raw byte at a flat `index`, border included."""
+        return self._buffer[index]
+
+    def find(self, char: str) -> np.ndarray:
+        """Coordinates (i, j) of every cell equal to ``char``."""
+        return np.argwhere(self.data == ord(char))
+
+    def row(self, i: int) -> np.ndarray:
+        return self.data[i]
+
+    def column(self, j: int) -> np.ndarray:
+        return self.data[:, j]
+
+    def diagonal(self, offset: int = 0, anti: bool = False) -> np.ndarray:
+        """
+        Down-right diagonal starting at column ``offset`` (row ``-offset`` when
+        negative), or the down-left one if ``anti`` is True.
+        """
+        grid = self.data[:, ::-1] if anti else self.data
+        return grid.diagonal(offset)
+
+    def _checked_index(self, key: tuple[int, int]) -> int:
+        i, j = key
+        if 0 <= i < self.height and 0 <= j < self.width:
+            return (i + self.pad) * self.stride + j + self.pad
+        raise KeyError(key)
+
+    def __getitem__(self, key: tuple[int, int]) -> str:
+        return chr(self._buffer[self._checked_index(key)])
+
+    def __setitem__(self, key: tuple[int, int], value: str) -> None:
+        self._buffer[self._checked_index(key)] = ord(value)
+
+    def __delitem__(self, key: tuple[int, int]) -> None:
+        raise TypeError("AocGrid cells cannot be deleted")
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            i, j = key
+        except (TypeError, ValueError):
+            return False
+        return 0 <= i < self.height and 0 <= j < self.width
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return product(range(self.height), range(self.width))
+
+    def __len__(self) -> int:
+        return self.height * self.width
+
+    def __str__(self) -> str:
+        return "\n".join(row.tobytes().decode("latin-1") for row in self.data)
+
+    def __repr__(self) -> str:
+        return f"AocGrid(height={self.height}, width={self.width})"
+
+
 def aoc_shape(input_str: str) -> tuple[int, int]:
     """
     Determine the shape of a grid represented by the input string.
@@ -208,15 +620,156 @@ def aoc_grid_dictionary(
     }
 
 
-def aoc_answer_display(func: Callable[..., Any]) -> Callable[..., Any]:
+AnswerSink = Callable[[Any, str], None]
+
+# Factories for the places an answer can be sent, keyed by the name used in
+# the AOC_ANSWER_SINK environment variable. A factory runs once, when a sink
+# is resolved, and returns the callable that receives every answer together
+# with the qualified name of the function that produced it.
+AOC_ANSWER_SINKS: dict[str, Callable[[], AnswerSink]] = {}
+
+# Answers gathered by the "memory" sink, as (source, answer) pairs.
+aoc_collected_answers: list[tuple[str, Any]] = []
+
+
+def aoc_register_answer_sink(
+    name: str,
+) -> Callable[[Callable[[], AnswerSink]], Callable[[], AnswerSink]]:
+    """
+    Register a sink factory under `name`.
+
+    Examples
+    --------
+    >>> @aoc_register_answer_sink("stderr")
+    ... def stderr_sink():
+    ...     return lambda answer, source: print(answer, file=sys.stderr)
+    """
+
+    def register(factory: Callable[[], AnswerSink]) -> Callable[[], AnswerSink]:
+        AOC_ANSWER_SINKS[name] = factory
+        return factory
+
+    return register
+
+
+@aoc_register_answer_sink("stdout")
+def _stdout_sink() -> AnswerSink:
+    return lambda answer, source: print(answer)
+
+
+def _in_ipython_shell() -> bool:
+    """
+    Whether answers are produced inside a running IPython shell or kernel, as
+    opposed to a script that merely imported IPython.
     """
-    A decorator that displays the return value of a function using IPython.display if available,
-    falls back to print if not. Also copies the result to clipboard.
+    ipython = sys.modules.get("IPython")
+    return ipython is not None and ipython.get_ipython() is not None
+
+
+@aoc_register_answer_sink("display")
+def _display_sink() -> AnswerSink:
+    if not _in_ipython_shell():
+        return _stdout_sink()
+
+    from IPython.display import display
+
+    return lambda answer, source: display(answer)
+
+
+@aoc_register_answer_sink("clipboard")
+def _clipboard_sink() -> AnswerSink:
+    return lambda answer, source: pyperclip.copy(str(answer))
+
+
+@aoc_register_answer_sink("memory")
+def _memory_sink() -> AnswerSink:
+    return lambda answer, source: aoc_collected_answers.append((source, answer))
+
+
+@aoc_register_answer_sink("jsonl")
+def _jsonl_sink() -> AnswerSink:
+    path = os.environ.get("AOC_ANSWER_FILE", "answers.jsonl")
+
+    def write(answer: Any, source: str) -> None:
+        # Opened per answer in append mode so concurrent worker processes
+        # never interleave partial lines.
+        with open(path, "a", encoding="utf-8") as file:
+            file.write(
+                json.dumps(
+                    {"source": source, "answer": answer},
+                    default=lambda value: (
+                        value.item() if hasattr(value, "item") else str(value)
+                    ),
+                )
+                + "\n"
+            )
+
+    return write
+
+
+def aoc_answer_sink(names: str | None = None) -> AnswerSink:
+    """
+    Resolve a comma separated list of sink names into a single sink.
+
+    Parameters
+    ----------
+    names : str | None, optional
+        Sink names such as ``"stdout"`` or ``"jsonl,memory"``. Defaults to the
+        AOC_ANSWER_SINK environment variable, and when that is unset to
+        ``"display,clipboard"`` inside a running IPython shell and ``"stdout"``
+        elsewhere, so headless runs never start a clipboard process, even when
+        they import IPython.
+
+    Returns
+    -------
+    Callable[[Any, str], None]
+        A sink that forwards each answer to every named sink.
+
+    Raises
+    ------
+    KeyError
+        If a name has not been registered.
+    """
+    if names is None:
+        names = os.environ.get("AOC_ANSWER_SINK") or (
+            "display,clipboard" if _in_ipython_shell() else "stdout"
+        )
+
+    sinks = []
+    for name in names.split(","):
+        if name.strip() not in AOC_ANSWER_SINKS:
+            raise KeyError(
+                f"Unknown answer sink {name.strip()!r}, "
+                f"expected one of {sorted(AOC_ANSWER_SINKS)}"
+            )
+        sinks.append(AOC_ANSWER_SINKS[name.strip()]())
+
+    if len(sinks) == 1:
+        return sinks[0]
+
+    def broadcast(answer: Any, source: str) -> None:
+        for sink in sinks:
+            sink(answer, source)
+
+    return broadcast
+
+
+def aoc_answer_display(func: Any = None, *, sink: str | None = None) -> Any:
+    """
+    A decorator that sends the return value of a function to the answer sink,
+    by default IPython.display plus the clipboard inside IPython and stdout
+    elsewhere (see `aoc_answer_sink`). The sink is resolved once, when the
+    function is decorated.
+
+    Called with a value instead of a function, the value is sent straight to
+    the sink and returned.
 
     Parameters
     ----------
     func : Callable
         The function whose return value should be displayed
+    sink : str | None, optional
+        Sink names overriding the environment, by default None.
 
     Returns
     -------
@@ -230,24 +783,111 @@ def aoc_answer_display(func: Callable[..., Any]) -> Callable[..., Any]:
     ...     return "Answer: 42"
     >>> result = solve_day_1("some input")
     Answer: 42
+    >>> @aoc_answer_display(sink="memory")
+    ... def solve_day_2(input_data):
+    ...     return 7
+    >>> solve_day_2("some input"), aoc_collected_answers[-1]
+    (7, ('solve_day_2', 7))
     """
+    if func is None:
+        return lambda func: aoc_answer_display(func, sink=sink)
+
+    emit = aoc_answer_sink(sink)
+
+    if not callable(func):
+        emit(func, "")
+        return func
 
     @wraps(func)
     def wrapper(*args, **kwargs) -> Any:
         result = func(*args, **kwargs)
+        emit(result, func.__qualname__)
+        return result
 
-        try:
-            from IPython.display import display
+    return wrapper
 
-            pyperclip.copy(str(result))
-            display(result)
-        except ImportError:
-            pyperclip.copy(str(result))
-            print(result)
 
-        return result
+def aoc_held_karp(
+    distances: np.ndarray,
+    cycle: bool = False,
+    maximise: bool = False,
+    add_zero_node: bool = False,
+) -> int:
+    """
+    Solve a travelling salesman problem exactly with the Held-Karp bitmask
+    dynamic programme.
 
-    return wrapper
+    ``dp[mask, j]`` holds the best cost of a path that visits exactly the
+    nodes in ``mask`` and ends at ``j``. Subsets are processed one popcount
+    layer at a time and every layer is extended with NumPy operations, which
+    takes O(n² 2ⁿ) work instead of the O(n!) of trying every permutation.
+
+    Parameters
+    ----------
+    distances : np.ndarray
+        Square (n, n) matrix where ``distances[i, j]`` is the cost of going
+        from node i to node j.
+    cycle : bool, optional
+        Flag indicating whether the tour must return to its first node, by
+        default False (an open path that may start and end anywhere).
+    maximise : bool, optional
+        Flag indicating whether to look for the most expensive route instead
+        of the cheapest one, by default False.
+    add_zero_node : bool, optional
+        Flag indicating whether to add an extra node that costs nothing to
+        reach or to leave, by default False.
+
+    Returns
+    -------
+    int
+        The cost of the best route.
+
+    Examples
+    --------
+    >>> aoc_held_karp(np.array([[0, 10, 20], [10, 0, 15], [20, 15, 0]]))
+    25
+    >>> aoc_held_karp(np.array([[0, 10, 20], [10, 0, 15], [20, 15, 0]]), cycle=True)
+    45
+    """
+    matrix = np.asarray(distances, dtype=np.int64)
+    if add_zero_node:
+        matrix = np.pad(matrix, ((0, 1), (0, 1)))
+    if maximise:
+        matrix = -matrix
+
+    if cycle:
+        # Fix the first node as the start, so only the others are permuted
+        start, back, matrix = matrix[0, 1:], matrix[1:, 0], matrix[1:, 1:]
+    else:
+        start = back = np.zeros(len(matrix), dtype=np.int64)
+
+    n = len(matrix)
+    if n == 0:
+        return 0
+
+    unreachable = np.iinfo(np.int64).max // 4
+    nodes = np.arange(n)
+    dp = np.full((1 << n, n), unreachable, dtype=np.int64)
+    dp[1 << nodes, nodes] = start
+
+    masks = np.arange(1 << n)
+    popcount = np.zeros(1 << n, dtype=np.uint8)
+    for node in nodes:
+        popcount += ((masks >> node) & 1).astype(np.uint8)
+
+    for size in range(1, n):
+        layer = np.flatnonzero(popcount == size)
+
+        best = np.full((len(layer), n), unreachable, dtype=np.int64)
+        for node in nodes:
+            np.minimum(best, dp[layer, node][:, None] + matrix[node], out=best)
+
+        for node in nodes:
+            free = ((layer >> node) & 1) == 0
+            dp[layer[free] | (1 << node), node] = best[free, node]
+
+    result = int((dp[-1] + back).min())
+    return -result if maximise else result
 
 
 def aoc_print_functions(verbose: bool = False):
@@ -354,6 +994,8 @@ def aoc_transpose_list_of_lists(input_list: list[list[Any]]) -> None:
 
 
 def aoc_retrive_question_text() -> None:
+    from markdownify import markdownify as md
+
     url = pyperclip.paste()
     text = (
         md(requests.get(url).text)
@@ -410,3 +1052,166 @@ def aoc_retrieve_diagonals(input_grid: str) -> str:
 
 def aoc_transpose_block_text(input_grid: str) -> str:
     return "\n".join("".join(i) for i in zip(*input_grid.split()))
+
+
+def _md5_nonce_chunk(
+    prefix: bytes, start: int, stop: int, leading_zeros: int
+) -> list[tuple[int, str]]:
+    """
+    Hash ``prefix + str(index)`` for every index in ``[start, stop)`` and
+    return the indices whose digest starts with ``leading_zeros`` hex zeros.
+
+    The prefix is hashed once and the state is cloned with ``md5().copy()``
+    for every index, and the zero test is done on the raw digest bytes so the
+    hex conversion only happens for hits.
+    """
+    base = hashlib.md5(prefix)
+    zero_bytes = bytes(leading_zeros // 2)
+    odd_nibble = leading_zeros % 2
+    boundary = leading_zeros // 2
+
+    hits = []
+    for index in range(start, stop):
+        md5 = base.copy()
+        md5.update(str(index).encode())
+        digest = md5.digest()
+        if digest.startswith(zero_bytes) and (
+            not odd_nibble or digest[boundary] < 0x10
+        ):
+            hits.append((index, digest.hex()))
+    return hits
+
+
+def aoc_md5_nonce_search(
+    prefix: str,
+    leading_zeros: int = 5,
+    start: int = 0,
+    chunk_size: int = 200_000,
+    processes: int | None = None,
+) -> Iterator[tuple[int, str]]:
+    """
+    Lazily find every index whose MD5 of ``prefix + str(index)`` starts with
+    ``leading_zeros`` hexadecimal zeros.
+
+    The index space is split into chunks of ``chunk_size`` that are hashed
+    across a process pool. Chunks are consumed in submission order so hits are
+    yielded in increasing index order, and the search has no upper bound: stop
+    iterating once you have what you need.
+
+    Parameters
+    ----------
+    prefix : str
+        The secret key / door ID that every candidate starts with.
+    leading_zeros : int, optional
+        Number of leading hexadecimal zeros a hit must have, by default 5.
+    start : int, optional
+        First index to try, by default 0.
+    chunk_size : int, optional
+        Number of indices hashed per task, by default 200_000.
+    processes : int | None, optional
+        Number of worker processes, by default ``os.cpu_count()``.
+
+    Yields
+    ------
+    tuple[int, str]
+        The index and the hexadecimal digest of every hit.
+
+    Examples
+    --------
+    >>> next(aoc_md5_nonce_search("abcdef", 5, start=1))
+    (609043, '000001dbbfa3a5c83a2d506429c7b00e')
+    """
+    encoded_prefix = prefix.encode()
+    processes = processes or os.cpu_count() or 1
+    chunk_starts = count(start, chunk_size)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    executor = ProcessPoolExecutor(max_workers=processes)
+    try:
+        # Keep a couple of chunks per worker in flight so no core sits idle
+        # while the oldest chunk is being drained.
+        pending = [
+            executor.submit(
+                _md5_nonce_chunk,
+                encoded_prefix,
+                chunk_start,
+                chunk_start + chunk_size,
+                leading_zeros,
+            )
+            for chunk_start in (next(chunk_starts) for _ in range(2 * processes))
+        ]
+        while True:
+            hits = pending.pop(0).result()
+            chunk_start = next(chunk_starts)
+            pending.append(
+                executor.submit(
+                    _md5_nonce_chunk,
+                    encoded_prefix,
+                    chunk_start,
+                    chunk_start + chunk_size,
+                    leading_zeros,
+                )
+            )
+            yield from hits
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def aoc_import_time(
+    module: str = "aoc_utils", repeats: int = 5, budget: float | None = None
+) -> float:
+    """
+    Measure how long ``import module`` takes in a fresh interpreter.
+
+    Each run uses ``python -X importtime`` so interpreter start-up is left
+    out, and the fastest of `repeats` runs is reported.
+
+    Parameters
+    ----------
+    module : str, optional
+        The module to import, by default "aoc_utils".
+    repeats : int, optional
+        Number of fresh interpreters to time, by default 5.
+    budget : float | None, optional
+        Maximum allowed import time in seconds, by default None.
+
+    Returns
+    -------
+    float
+        The import time in seconds.
+
+    Raises
+    ------
+    RuntimeError
+        If `budget` is given and the import is slower than it.
+
+    Examples
+    --------
+    >>> aoc_import_time(budget=0.05)  # doctest: +SKIP
+    0.0121
+    """
+    import subprocess
+    import sys
+
+    timings = []
+    for _ in range(repeats):
+        stderr = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stderr
+        for line in stderr.splitlines():
+            _, cumulative, name = line.split("|")
+            if name.strip() == module:
+                timings.append(int(cumulative) / 1e6)
+
+    best = min(timings)
+    if budget is not None and best > budget:
+        raise RuntimeError(
+            f"import {module} took {best * 1e3:.1f} ms, over the "
+            f"{budget * 1e3:.1f} ms budget"
+        )
+    return best
@@ -0,0 +1,501 @@
+"""
+Benchmark the hot function of each day on example and synthetic inputs.
+
+Every `Benchmark` loads the definitions of one day script (functions,
+classes, imports and cheap constants, none of the notebook cells that read
+puzzle inputs), then times its hot function on the example embedded in the
+script and on seeded synthetic inputs of growing size. Best-of-N wall time
+and the tracemalloc peak are compared with a stored baseline, and the run
+fails when anything got slower or hungrier than `--threshold` times the
+baseline, or when ``import aoc_utils`` takes longer than `--import-budget`.
+
+Examples
+--------
+    python benchmarks.py --save-baseline
+    python benchmarks.py --filter 2015 --threshold 1.3
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Iterator, NamedTuple
+
+from generators import generate
+
+ROOT = Path(__file__).resolve().parent
+BASELINE = ROOT / "benchmarks_baseline.json"
+
+
+# %% Benchmarks
+class Benchmark(NamedTuple):
+    """
+    How to exercise the hot function of one day.
+
+    Attributes
+    ----------
+    path : str
+        The day script, relative to the repository root.
+    function : str
+        Name of the hot function, used in reports.
+    call : Callable[[dict, str], Any]
+        Runs the function given the day's namespace and an input string.
+    input_format : str
+        Name of the synthetic input format in `generators.FORMATS`.
+    sizes : tuple[int, ...]
+        Synthetic input sizes, typically a base size and 10x and 100x that.
+    example : str | None
+        Name of the example variable embedded in the script, if it's usable.
+    """
+
+    path: str
+    function: str
+    call: Callable[[dict, str], Any]
+    input_format: str
+    sizes: tuple[int, ...]
+    example: str | None = None
+
+    @property
+    def name(self) -> str:
+        return f"{self.path}::{self.function}"
+
+
+def _door_passwords(ns: dict, text: str) -> list[list[tuple[int, str]]]:
+    # The first eight four-zero hits per door, the search 2016/day_05 runs
+    # with five zeros, which would take minutes per door.
+    return [
+        list(islice(ns["aoc_md5_nonce_search"](door, 4), 8))
+        for door in text.splitlines()
+    ]
+
+
+def _molecule_steps(ns: dict, text: str) -> int:
+    rules, molecule = text.split("\n\n")
+    engine = ns["MoleculeEngine"](
+        [tuple(rule.split(" => ")) for rule in rules.splitlines()]
+    )
+    return engine.steps_from_electron(molecule.strip())
+
+
+BENCHMARKS = [
+    Benchmark(
+        "2015/day04.py",
+        "solve",
+        # Four zeros instead of five so a key takes under a second.
+        lambda ns, text: [ns["solve"](key, 4) for key in text.splitlines()],
+        "keys",
+        (1, 2, 4),
+    ),
+    Benchmark(
+        "2015/day06.py",
+        "compressed_lights",
+        lambda ns, text: ns["compressed_lights"](text, brightness=True),
+        "lights",
+        (30, 300, 3000),
+    ),
+    Benchmark(
+        "2015/day07.py",
+        "part_one_and_two",
+        lambda ns, text: ns["part_one_and_two"](text, "a"),
+        "circuit",
+        (1_000, 10_000, 100_000),
+    ),
+    Benchmark(
+        "2015/day09.py",
+        "part_one_and_two",
+        lambda ns, text: ns["part_one_and_two"](text, "min"),
+        "routes",
+        (8, 12, 15),
+        "test",
+    ),
+    Benchmark(
+        "2015/day10.py",
+        "look_and_say_digits",
+        lambda ns, text: ns["look_and_say_digits"](text.strip(), 30),
+        "digits",
+        (10, 100, 1_000),
+        "input_10",
+    ),
+    Benchmark(
+        "2015/day11.py",
+        "next_passwords",
+        lambda ns, text: [ns["next_passwords"](p, 2) for p in text.splitlines()],
+        "passwords",
+        (1, 10, 100),
+        "INPUT_11",
+    ),
+    Benchmark(
+        "2015/day12.py",
+        "sum_json_numbers",
+        lambda ns, text: ns["sum_json_numbers"](
+            io.BytesIO(text.encode()), ignore="red"
+        ),
+        "json",
+        (100, 1_000, 10_000),
+    ),
+    Benchmark(
+        "2015/day14.py",
+        "max_pole_position_count",
+        lambda ns, text: ns["max_pole_position_count"](
+            ns["parse_reindeer_specs"](text), 100_000
+        ),
+        "reindeer",
+        (9, 90, 900),
+        "test",
+    ),
+    Benchmark(
+        "2015/day15.py",
+        "branch_and_bound_score",
+        lambda ns, text: ns["branch_and_bound_score"](ns["ingredient_stats"](text)),
+        "ingredients",
+        (4, 6, 8),
+        "test",
+    ),
+    Benchmark(
+        "2015/day17.py",
+        "combos_for_size",
+        lambda ns, text: ns["combos_for_size"](list(map(int, text.split())), 150),
+        "containers",
+        (20, 100, 500),
+        "INPUT_17",
+    ),
+    Benchmark(
+        "2015/day18.py",
+        "take_steps",
+        lambda ns, text: ns["take_steps"](ns["generate_grid"](text), 100).sum(),
+        "life",
+        (100, 316, 1000),
+        "test",
+    ),
+    Benchmark(
+        "2015/day19.py",
+        "steps_from_electron",
+        _molecule_steps,
+        "molecules",
+        (50, 150, 500),
+    ),
+    Benchmark(
+        "2022/day07.py",
+        "part_1",
+        lambda ns, text: ns["part_1"](text),
+        "shell",
+        (1_000, 10_000, 100_000),
+    ),
+    Benchmark(
+        "2022/day08.py",
+        "part_one",
+        lambda ns, text: ns["part_one"](text),
+        "trees",
+        (30, 95, 300),
+    ),
+    Benchmark(
+        "2022/day11.py",
+        "productive_monkey_in_the_middle",
+        lambda ns, text: ns["productive_monkey_in_the_middle"](
+            text, rounds=200, relief=False
+        ),
+        "monkeys",
+        (8, 80, 800),
+        "test_11",
+    ),
+    Benchmark(
+        "2024/day_05.py",
+        "solve_part_one",
+        lambda ns, text: ns["solve_part_one"](text),
+        "pages",
+        (200, 2_000, 20_000),
+        "example",
+    ),
+    Benchmark(
+        "2016/day_01.py",
+        "part2",
+        lambda ns, text: ns["part2"](text),
+        "taxicab",
+        (150, 1_500, 15_000),
+    ),
+    Benchmark(
+        "2016/day_02.py",
+        "part_two",
+        lambda ns, text: ns["part_two"](text),
+        "keypad",
+        (20, 200, 2000),
+        "example",
+    ),
+    Benchmark(
+        "2016/day_03.py",
+        "part_two",
+        lambda ns, text: ns["part_two"](text),
+        "triangles",
+        (1_800, 18_000, 180_000),
+        "example_02",
+    ),
+    Benchmark(
+        "2016/day_04.py",
+        "part_one",
+        lambda ns, text: ns["part_one"](text),
+        "rooms",
+        (1_000, 10_000, 100_000),
+        "examples",
+    ),
+    Benchmark(
+        "2016/day_05.py",
+        "aoc_md5_nonce_search",
+        _door_passwords,
+        "keys",
+        (1, 2, 4),
+        "example",
+    ),
+    Benchmark(
+        "2016/day_06.py",
+        "part_one",
+        # the histogram is cached per input, so clear it to time a cold call
+        lambda ns, text: (ns["column_histogram"].cache_clear(), ns["part_one"](text)),
+        "repetition",
+        (6_000, 60_000, 600_000),
+        "example",
+    ),
+]
+
+
+# %% Loading and measuring
+@contextmanager
+def _in_directory(path: Path) -> Iterator[None]:
+    cwd = os.getcwd()
+    sys.path.insert(0, str(path))
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(cwd)
+        sys.path.remove(str(path))
+
+
+def _bound_names(node: ast.stmt) -> set[str]:
+    if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+        return {node.name}
+    targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+    return {
+        name.id
+        for target in targets
+        for name in ast.walk(target)
+        if isinstance(name, ast.Name)
+    }
+
+
+def load_definitions(path: str | Path) -> dict[str, Any]:
+    """
+    Execute the reusable parts of a day script and return its namespace.
+
+    Imports, functions, classes and assignments are run in order, seeded with
+    the `aoc_utils` globals like the IPython startup file does. Expression
+    cells, loops and ``__main__`` blocks are skipped, and so is any
+    assignment that calls one of the script's own functions, since those are
+    the notebook cells doing the actual solving. Assignments that fail, such
+    as reading a puzzle input that isn't there, are skipped as well, and so
+    are definitions that only fail because they use a skipped name. Any other
+    failure is raised, so a broken definition can't go unnoticed.
+    """
+    import aoc_utils
+
+    script = ROOT / path
+    tree = ast.parse(script.read_text(encoding="utf-8"), str(script))
+    defined = {
+        node.name
+        for node in tree.body
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef))
+    }
+
+    namespace = {
+        name: value
+        for name, value in vars(aoc_utils).items()
+        if not name.startswith("__")
+    }
+    namespace.update(__name__=script.stem, __file__=str(script))
+
+    skipped: set[str] = set()
+    with _in_directory(script.parent):
+        for node in tree.body:
+            assignment = isinstance(node, (ast.Assign, ast.AnnAssign))
+            if assignment:
+                if any(
+                    isinstance(call, ast.Call)
+                    and isinstance(call.func, ast.Name)
+                    and call.func.id in defined
+                    for call in ast.walk(node)
+                ):
+                    skipped.update(_bound_names(node))
+                    continue
+            elif not isinstance(
+                node,
+                (ast.Import, ast.ImportFrom, ast.FunctionDef, ast.ClassDef),
+            ):
+                continue
+            code = compile(ast.Module([node], []), str(script), "exec")
+            try:
+                exec(code, namespace)
+            except NameError as error:
+                if not assignment and error.name not in skipped:
+                    raise
+                skipped.update(_bound_names(node))
+            except Exception:
+                if not assignment:
+                    raise
+                skipped.update(_bound_names(node))
+
+    return namespace
+
+
+def measure(function: Callable[[], Any], repeat: int = 3) -> dict[str, float | int]:
+    """
+    Best-of-`repeat` wall time in seconds and the tracemalloc peak in bytes of
+    calling `function`. Memory is traced on a separate call so it doesn't
+    distort the timings.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"seconds": min(timings), "peak_bytes": peak}
+
+
+def run_benchmarks(
+    benchmarks: list[Benchmark], repeat: int = 3, seed: int = 2015
+) -> dict[str, dict[str, float | int]]:
+    """
+    Measure every benchmark on its example and each synthetic size.
+
+    Returns
+    -------
+    dict[str, dict[str, float | int]]
+        Measurements keyed by ``path::function[example]`` or
+        ``path::function[size]``.
+    """
+    results = {}
+    for benchmark in benchmarks:
+        namespace = load_definitions(benchmark.path)
+
+        inputs = {}
+        if benchmark.example and isinstance(namespace.get(benchmark.example), str):
+            inputs["example"] = namespace[benchmark.example]
+        for size in benchmark.sizes:
+            inputs[str(size)] = generate(benchmark.input_format, size, seed)
+
+        for label, text in inputs.items():
+            key = f"{benchmark.name}[{label}]"
+            with _in_directory(ROOT / Path(benchmark.path).parent):
+                results[key] = measure(lambda: benchmark.call(namespace, text), repeat)
+            print(
+                f"{results[key]['seconds']:10.4f}s "
+                f"{results[key]['peak_bytes'] / 2**20:9.1f} MiB  {key}",
+                file=sys.stderr,
+            )
+    return results
+
+
+def regressions(
+    results: dict[str, dict[str, float | int]],
+    baseline: dict[str, dict[str, float | int]],
+    threshold: float = 1.5,
+) -> list[str]:
+    """
+    Describe every measurement that is more than `threshold` times its
+    baseline. Timings under a millisecond are left out, they're mostly noise.
+    """
+    found = []
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+        for metric in ("seconds", "peak_bytes"):
+            before, after = baseline[key][metric], result[metric]
+            if metric == "seconds" and after < 1e-3:
+                continue
+            if before and after / before > threshold:
+                found.append(
+                    f"{key} {metric}: {before:.4g} -> {after:.4g} "
+                    f"({after / before:.2f}x)"
+                )
+    return found
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--filter", default="", help="only run names containing this")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per input")
+    parser.add_argument("--seed", type=int, default=2015, help="synthetic input seed")
+    parser.add_argument(
+        "--threshold", type=float, default=1.5, help="allowed slowdown ratio"
+    )
+    parser.add_argument(
+        "--import-budget",
+        type=float,
+        default=0.05,
+        help="seconds `import aoc_utils` may take, 0 to skip the check",
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="store these results as the new baseline",
+    )
+    args = parser.parse_args(argv)
+
+    # Decorated solvers shouldn't print or touch the clipboard while timed.
+    os.environ.setdefault("AOC_ANSWER_SINK", "memory")
+    sys.path.insert(0, str(ROOT))
+
+    from aoc_utils import aoc_import_time
+
+    # The startup file is imported by every session, so a slow import is a
+    # regression of every day at once.
+    slow_import = None
+    if args.import_budget:
+        try:
+            seconds = aoc_import_time(budget=args.import_budget)
+            print(f"{seconds:10.4f}s              import aoc_utils", file=sys.stderr)
+        except RuntimeError as error:
+            slow_import = str(error)
+            print(f"REGRESSION {slow_import}", file=sys.stderr)
+
+    results = run_benchmarks(
+        [b for b in BENCHMARKS if args.filter in b.name], args.repeat, args.seed
+    )
+
+    if args.save_baseline:
+        baseline = {}
+        if args.baseline.exists():
+            baseline = json.loads(args.baseline.read_text())
+        baseline.update(results)
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True))
+        print(f"baseline written to {args.baseline}", file=sys.stderr)
+        return 1 if slow_import else 0
+
+    if not args.baseline.exists():
+        print(f"no baseline at {args.baseline}, nothing to compare", file=sys.stderr)
+        return 1 if slow_import else 0
+
+    found = regressions(results, json.loads(args.baseline.read_text()), args.threshold)
+    for line in found:
+        print(f"REGRESSION {line}", file=sys.stderr)
+    return 1 if found or slow_import else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""
+Seedable synthetic puzzle inputs of any size.
+
+Each generator takes a ``size`` and a `random.Random` and lazily yields the
+pieces of one input, so `write_input` can stream millions of lines to disk
+without holding them in memory. The same seed always produces the same
+input.
+
+Examples
+--------
+>>> generate("lights", 2, seed=1)
+'turn on 137,821 through 582,867\\nturn off 120,507 through 261,779'
+>>> characters = write_input("bags", "input07.txt", 10**6, seed=7)  # doctest: +SKIP
+
+From the shell::
+
+    python -m generators bags 1000000 -o 2020/input07.txt --seed 7
+"""
+
+from __future__ import annotations
+
+from random import Random
+from typing import Callable, Iterator, NamedTuple
+
+from .documents import json_document
+from .grids import life_grid, tree_grid, word_search
+from .instructions import (
+    keypad_moves,
+    light_instructions,
+    monkey_notes,
+    shell_history,
+    taxicab_instructions,
+)
+from .records import (
+    container_sizes,
+    eight_letter_words,
+    look_and_say_seed,
+    repetition_code,
+    room_names,
+    triangle_sides,
+)
+from .rules import (
+    bag_rules,
+    circuit_wiring,
+    city_distances,
+    ingredient_properties,
+    molecule_rules,
+    page_ordering,
+    reindeer_specs,
+)
+
+LineGenerator = Callable[[int, Random], Iterator[str]]
+
+
+class InputFormat(NamedTuple):
+    """
+    A generator and how its pieces are joined.
+
+    Attributes
+    ----------
+    generator : LineGenerator
+        Yields the pieces of an input for a given size and random generator.
+    puzzle : str
+        The day the format belongs to, e.g. ``"2015/day06"``.
+    separator : str
+        Written between pieces, ``"\\n"`` for one piece per line.
+    """
+
+    generator: LineGenerator
+    puzzle: str
+    separator: str = "\n"
+
+
+FORMATS: dict[str, InputFormat] = {
+    "keys": InputFormat(eight_letter_words, "2015/day04"),
+    "lights": InputFormat(light_instructions, "2015/day06"),
+    "circuit": InputFormat(circuit_wiring, "2015/day07"),
+    "routes": InputFormat(city_distances, "2015/day09"),
+    "digits": InputFormat(look_and_say_seed, "2015/day10"),
+    "passwords": InputFormat(eight_letter_words, "2015/day11"),
+    "json": InputFormat(json_document, "2015/day12"),
+    "reindeer": InputFormat(reindeer_specs, "2015/day14"),
+    "ingredients": InputFormat(ingredient_properties, "2015/day15"),
+    "containers": InputFormat(container_sizes, "2015/day17"),
+    "life": InputFormat(life_grid, "2015/day18"),
+    "molecules": InputFormat(molecule_rules, "2015/day19"),
+    "taxicab": InputFormat(taxicab_instructions, "2016/day_01", separator=""),
+    "keypad": InputFormat(keypad_moves, "2016/day_02"),
+    "triangles": InputFormat(triangle_sides, "2016/day_03"),
+    "rooms": InputFormat(room_names, "2016/day_04"),
+    "repetition": InputFormat(repetition_code, "2016/day_06"),
+    "bags": InputFormat(bag_rules, "2020/day_07"),
+    "shell": InputFormat(shell_history, "2022/day07"),
+    "trees": InputFormat(tree_grid, "2022/day08"),
+    "monkeys": InputFormat(monkey_notes, "2022/day11"),
+    "xmas": InputFormat(word_search, "2024/day_04"),
+    "pages": InputFormat(page_ordering, "2024/day_05"),
+}
+
+
+def stream(name: str, size: int, seed: int = 0) -> Iterator[str]:
+    """
+    Yield the text of input `name` piece by piece, separators included, with
+    no trailing newline.
+
+    Raises
+    ------
+    KeyError
+        If `name` is not one of `FORMATS`.
+    """
+    input_format = FORMATS[name]
+    pieces = input_format.generator(size, Random(seed))
+    first = next(pieces, None)
+    if first is None:
+        return
+    yield first
+    for piece in pieces:
+        yield input_format.separator + piece
+
+
+def generate(name: str, size: int, seed: int = 0) -> str:
+    """The whole of input `name` as a string, for sizes that fit in memory."""
+    return "".join(stream(name, size, seed))
+
+
+def write_input(name: str, path: str, size: int, seed: int = 0) -> int:
+    """
+    Stream input `name` to `path`, ending with a newline like a real puzzle
+    input, and return the number of characters written.
+    """
+    written = 0
+    with open(path, "w", encoding="utf-8", buffering=1 << 20) as file:
+        for piece in stream(name, size, seed):
+            written += file.write(piece)
+        written += file.write("\n")
+    return written
+
+
+__all__ = [
+    "FORMATS",
+    "InputFormat",
+    "LineGenerator",
+    "bag_rules",
+    "circuit_wiring",
+    "city_distances",
+    "container_sizes",
+    "eight_letter_words",
+    "generate",
+    "ingredient_properties",
+    "json_document",
+    "keypad_moves",
+    "life_grid",
+    "light_instructions",
+    "look_and_say_seed",
+    "molecule_rules",
+    "monkey_notes",
+    "page_ordering",
+    "reindeer_specs",
+    "repetition_code",
+    "room_names",
+    "shell_history",
+    "stream",
+    "taxicab_instructions",
+    "tree_grid",
+    "triangle_sides",
+    "word_search",
+    "write_input",
+]
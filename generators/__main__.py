@@ -0,0 +1,32 @@
+"""Write a synthetic puzzle input to disk, see ``python -m generators -h``."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+
+from . import FORMATS, write_input
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m generators", description="Write a synthetic puzzle input."
+    )
+    parser.add_argument(
+        "format",
+        choices=sorted(FORMATS),
+        help="input format: "
+        + ", ".join(f"{name} ({FORMATS[name].puzzle})" for name in sorted(FORMATS)),
+    )
+    parser.add_argument("size", type=int, help="lines, items or grid side")
+    parser.add_argument("--output", "-o", required=True, help="file to write")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    written = write_input(args.format, args.output, args.size, args.seed)
+    print(f"{written} characters written to {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+"""Structured documents."""
+
+from __future__ import annotations
+
+import json
+import string
+from random import Random
+from typing import Any, Iterator
+
+
+def _json_value(rng: Random, depth: int) -> Any:
+    kind = rng.random()
+    if depth <= 0 or kind < 0.4:
+        return rng.choice(
+            [
+                rng.randint(-500, 500),
+                rng.randint(-500, 500),
+                "red",
+                "".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 8))),
+            ]
+        )
+    if kind < 0.7:
+        return [_json_value(rng, depth - 1) for _ in range(rng.randint(0, 5))]
+    return {
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 6))): (
+            _json_value(rng, depth - 1)
+        )
+        for _ in range(rng.randint(0, 5))
+    }
+
+
+def json_document(size: int, rng: Random, depth: int = 4) -> Iterator[str]:
+    """
+    2015 day 12: a JSON array of `size` nested values, one element per line.
+
+    Numbers, arrays, objects and ``"red"`` strings are mixed so both parts of
+    the puzzle have work to do. Only one element is in memory at a time.
+    """
+    yield "["
+    for i in range(size):
+        separator = "," if i < size - 1 else ""
+        yield json.dumps(_json_value(rng, depth), separators=(",", ":")) + separator
+    yield "]"
@@ -0,0 +1,25 @@
+"""Character grids, one row per line."""
+
+from __future__ import annotations
+
+import string
+from random import Random
+from typing import Iterator
+
+
+def life_grid(size: int, rng: Random) -> Iterator[str]:
+    """2015 day 18: a `size` x `size` grid of ``#`` and ``.``."""
+    for _ in range(size):
+        yield "".join(rng.choices("#.", k=size))
+
+
+def tree_grid(size: int, rng: Random) -> Iterator[str]:
+    """2022 day 8: a `size` x `size` grid of tree heights."""
+    for _ in range(size):
+        yield "".join(rng.choices(string.digits, k=size))
+
+
+def word_search(size: int, rng: Random) -> Iterator[str]:
+    """2024 day 4: a `size` x `size` grid of ``XMAS`` letters."""
+    for _ in range(size):
+        yield "".join(rng.choices("XMAS", k=size))
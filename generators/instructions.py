@@ -0,0 +1,71 @@
+"""Instruction streams: one command per line, or per comma on a single line."""
+
+from __future__ import annotations
+
+from random import Random
+from typing import Iterator
+
+
+def light_instructions(size: int, rng: Random) -> Iterator[str]:
+    """2015 day 6: ``turn on 0,0 through 999,999`` style instructions."""
+    for _ in range(size):
+        x1, x2 = sorted(rng.randrange(1000) for _ in range(2))
+        y1, y2 = sorted(rng.randrange(1000) for _ in range(2))
+        operation = rng.choice(("turn on", "turn off", "toggle"))
+        yield f"{operation} {x1},{y1} through {x2},{y2}"
+
+
+def taxicab_instructions(size: int, rng: Random) -> Iterator[str]:
+    """
+    2016 day 1: a single line of `size` ``R2, L3`` turns. The turns are
+    yielded one at a time, separator included, so the line is never built in
+    memory; join them with ``""``.
+    """
+    for i in range(size):
+        separator = ", " if i < size - 1 else ""
+        yield f"{rng.choice('LR')}{rng.randint(1, 200)}{separator}"
+
+
+def keypad_moves(size: int, rng: Random) -> Iterator[str]:
+    """2016 day 2: `size` lines of ``UDLR`` moves."""
+    for _ in range(size):
+        yield "".join(rng.choices("UDLR", k=rng.randint(200, 600)))
+
+
+def shell_history(size: int, rng: Random) -> Iterator[str]:
+    """2022 day 7: about `size` lines of ``cd``/``ls`` terminal output."""
+    yield "$ cd /"
+    depth = 0
+    for _ in range(size // 6 + 1):
+        yield "$ ls"
+        children = [f"d{rng.randrange(10**6)}" for _ in range(rng.randint(0, 3))]
+        for child in children:
+            yield f"dir {child}"
+        for _ in range(rng.randint(1, 3)):
+            yield f"{rng.randint(1, 300_000)} f{rng.randrange(10**6)}.txt"
+        if children and (depth == 0 or rng.random() < 0.6):
+            yield f"$ cd {rng.choice(children)}"
+            depth += 1
+        elif depth:
+            yield "$ cd .."
+            depth -= 1
+
+
+def monkey_notes(size: int, rng: Random) -> Iterator[str]:
+    """2022 day 11: eight monkeys holding `size` items between them."""
+    primes = [2, 3, 5, 7, 11, 13, 17, 19]
+    rng.shuffle(primes)
+    for monkey, prime in enumerate(primes):
+        items = [rng.randint(50, 99) for _ in range(max(1, size // 8))]
+        operation = rng.choice(
+            ["old * old", f"old * {rng.randint(2, 19)}", f"old + {rng.randint(1, 9)}"]
+        )
+        if_true, if_false = rng.sample([m for m in range(8) if m != monkey], 2)
+        if monkey:
+            yield ""
+        yield f"Monkey {monkey}:"
+        yield f"  Starting items: {', '.join(map(str, items))}"
+        yield f"  Operation: new = {operation}"
+        yield f"  Test: divisible by {prime}"
+        yield f"    If true: throw to monkey {if_true}"
+        yield f"    If false: throw to monkey {if_false}"
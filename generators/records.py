@@ -0,0 +1,59 @@
+"""Independent records, one per line."""
+
+from __future__ import annotations
+
+import string
+from random import Random
+from typing import Iterator
+
+
+def triangle_sides(size: int, rng: Random) -> Iterator[str]:
+    """2016 day 3: `size` rows of three side lengths, in columns of width 5."""
+    for _ in range(size - size % 3):
+        yield "".join(f"{rng.randint(1, 999):5}" for _ in range(3))
+
+
+def room_names(size: int, rng: Random) -> Iterator[str]:
+    """2016 day 4: `size` encrypted room names, about half of them real."""
+    for _ in range(size):
+        words = [
+            "".join(rng.choices(string.ascii_lowercase[:12], k=rng.randint(3, 10)))
+            for _ in range(rng.randint(2, 5))
+        ]
+        letters = "".join(words)
+        checksum = "".join(
+            sorted(set(letters), key=lambda c: (-letters.count(c), c))[:5]
+        )
+        if rng.random() < 0.5:
+            checksum = "".join(rng.sample(string.ascii_lowercase, 5))
+        yield f"{'-'.join(words)}-{rng.randint(100, 999)}[{checksum}]"
+
+
+def repetition_code(size: int, rng: Random) -> Iterator[str]:
+    """2016 day 6: `size` noisy copies of an eight letter message."""
+    message = rng.choices(string.ascii_lowercase, k=8)
+    for _ in range(size):
+        yield "".join(
+            char if rng.random() < 0.2 else rng.choice(string.ascii_lowercase)
+            for char in message
+        )
+
+
+def look_and_say_seed(size: int, rng: Random) -> Iterator[str]:
+    """2015 day 10: a single line of `size` digits from 1 to 3."""
+    yield "".join(rng.choices("123", k=size))
+
+
+def eight_letter_words(size: int, rng: Random) -> Iterator[str]:
+    """
+    2015 days 4 and 11, 2016 day 5: `size` random eight letter secret keys or
+    passwords, one per line.
+    """
+    for _ in range(size):
+        yield "".join(rng.choices(string.ascii_lowercase, k=8))
+
+
+def container_sizes(size: int, rng: Random) -> Iterator[str]:
+    """2015 day 17: `size` container capacities, one per line."""
+    for _ in range(size):
+        yield str(rng.randint(5, 50))
@@ -0,0 +1,185 @@
+"""
+Rule sets: distances, specifications, orderings, containment rules, wiring
+and replacement grammars.
+"""
+
+from __future__ import annotations
+
+import re
+import string
+from random import Random
+from typing import Iterator
+
+COLOURS = (
+    "aqua beige black blue bronze brown chartreuse coral crimson cyan fuchsia "
+    "gold gray green indigo lavender lime magenta maroon olive orange plum "
+    "purple red salmon silver tan teal tomato turquoise violet white yellow"
+).split()
+
+
+def _names(rng: Random, n: int, length: int = 6) -> list[str]:
+    names: set[str] = set()
+    while len(names) < n:
+        names.add(
+            "".join(rng.choices(string.ascii_uppercase, k=1))
+            + "".join(rng.choices(string.ascii_lowercase, k=length - 1))
+        )
+    return sorted(names)
+
+
+def _letters(number: int) -> str:
+    """Bijective base 26: 0 -> "a", 25 -> "z", 26 -> "aa", ..."""
+    word = ""
+    number += 1
+    while number:
+        number, remainder = divmod(number - 1, 26)
+        word = string.ascii_lowercase[remainder] + word
+    return word
+
+
+def city_distances(size: int, rng: Random) -> Iterator[str]:
+    """2015 day 9: a distance for every pair of `size` cities."""
+    cities = _names(rng, size)
+    for i, origin in enumerate(cities):
+        for destination in cities[i + 1 :]:
+            yield f"{origin} to {destination} = {rng.randint(1, 200)}"
+
+
+def reindeer_specs(size: int, rng: Random) -> Iterator[str]:
+    """2015 day 14: `size` reindeer flight specifications."""
+    for name in _names(rng, size):
+        yield (
+            f"{name} can fly {rng.randint(1, 30)} km/s for "
+            f"{rng.randint(1, 20)} seconds, but then must rest for "
+            f"{rng.randint(1, 200)} seconds."
+        )
+
+
+def page_ordering(size: int, rng: Random) -> Iterator[str]:
+    """2024 day 5: ordering rules over 49 pages, then `size` updates."""
+    pages = rng.sample(range(10, 100), 49)
+    for i, before in enumerate(pages):
+        for after in pages[i + 1 :]:
+            yield f"{before}|{after}" if rng.random() < 0.9 else f"{after}|{before}"
+    yield ""
+    for _ in range(size):
+        update = rng.sample(pages, rng.randrange(3, 24, 2))
+        if rng.random() < 0.5:
+            update.sort(key=pages.index)
+        yield ",".join(map(str, update))
+
+
+def bag_rules(size: int, rng: Random, window: int = 50) -> Iterator[str]:
+    """
+    2020 day 7: `size` ``light red bags contain 1 bright white bag.`` rules.
+
+    Bag ``i`` only ever contains bags ``i + 1 .. i + window``, which keeps the
+    rules acyclic without remembering the ones already written. ``shiny gold``
+    sits in the middle so plenty of bags can reach it and it has contents of
+    its own.
+    """
+    gold = size // 2
+
+    def bag(i: int) -> str:
+        if i == gold:
+            return "shiny gold"
+        return f"{_letters(i // len(COLOURS) + 26)} {COLOURS[i % len(COLOURS)]}"
+
+    for i in range(size):
+        inner = range(i + 1, min(size, i + 1 + window))
+        contents = sorted(rng.sample(inner, min(len(inner), rng.randint(0, 4))))
+        if not contents:
+            yield f"{bag(i)} bags contain no other bags."
+            continue
+        counts = [rng.randint(1, 5) for _ in contents]
+        yield f"{bag(i)} bags contain " + ", ".join(
+            f"{count} {bag(j)} bag{'s' if count > 1 else ''}"
+            for count, j in zip(counts, contents)
+        ) + "."
+
+
+def circuit_wiring(size: int, rng: Random, window: int = 20) -> Iterator[str]:
+    """
+    2015 day 7: `size` ``x AND y -> z`` gates feeding wire ``a``.
+
+    Like `bag_rules`, wire ``i`` only reads wires ``i + 1 .. i + window``, so
+    the circuit is acyclic but the lines come in reverse evaluation order. The
+    last wires are fed plain signals.
+    """
+    for i in range(size):
+        inputs = range(i + 1, min(size, i + 1 + window))
+        if not inputs:
+            yield f"{rng.randrange(1 << 16)} -> {_letters(i)}"
+            continue
+        x, y = (_letters(rng.choice(inputs)) for _ in range(2))
+        kind = rng.random()
+        if kind < 0.4:
+            gate = f"{x} {rng.choice(('AND', 'OR'))} {y}"
+        elif kind < 0.7:
+            gate = f"{x} {rng.choice(('LSHIFT', 'RSHIFT'))} {rng.randint(1, 15)}"
+        elif kind < 0.85:
+            gate = f"NOT {x}"
+        elif kind < 0.95:
+            gate = f"1 AND {x}"
+        else:
+            gate = x
+        yield f"{gate} -> {_letters(i)}"
+
+
+def ingredient_properties(size: int, rng: Random) -> Iterator[str]:
+    """2015 day 15: `size` cookie ingredients with single digit properties."""
+    for name in _names(rng, size):
+        properties = ", ".join(
+            f"{prop} {rng.randint(-5, 9)}"
+            for prop in ("capacity", "durability", "flavor", "texture")
+        )
+        yield f"{name}: {properties}, calories {rng.randint(1, 9)}"
+
+
+# The shape of the real puzzle's grammar: every rule grows a molecule by one
+# element, or wraps elements in Rn ... Ar with Y between them.
+MOLECULE_RULES = {
+    "e": ["HF", "NAl", "OMg"],
+    "Al": ["ThF", "ThRnFAr"],
+    "B": ["BCa", "TiB", "TiRnFAr"],
+    "Ca": ["CaCa", "PB", "PRnFAr", "SiRnFYFAr", "SiRnMgAr", "SiTh"],
+    "F": ["CaF", "PMg", "SiAl"],
+    "H": [
+        "CRnAlAr",
+        "CRnFYFYFAr",
+        "CRnFYMgAr",
+        "CRnMgYFAr",
+        "HCa",
+        "NRnFYFAr",
+        "NRnMgAr",
+        "NTh",
+        "OB",
+        "ORnFAr",
+    ],
+    "Mg": ["BF", "TiMg"],
+    "N": ["CRnFAr", "HSi"],
+    "O": ["CRnFYFAr", "CRnMgAr", "HP", "NRnFAr", "OTi"],
+    "P": ["CaP", "PTi", "SiRnFAr"],
+    "Si": ["CaSi"],
+    "Th": ["ThCa"],
+    "Ti": ["BP", "TiTi"],
+}
+
+
+def molecule_rules(size: int, rng: Random) -> Iterator[str]:
+    """
+    2015 day 19: the replacement rules, a blank line and a medicine molecule
+    grown from ``e`` by `size` random replacements, so it can always be made.
+    """
+    molecule = ["e"]
+    for _ in range(size):
+        i = rng.choice(
+            [i for i, element in enumerate(molecule) if element in MOLECULE_RULES]
+        )
+        replacement = rng.choice(MOLECULE_RULES[molecule[i]])
+        molecule[i : i + 1] = re.findall(r"[A-Z][a-z]?", replacement)
+    for element, replacements in MOLECULE_RULES.items():
+        for replacement in replacements:
+            yield f"{element} => {replacement}"
+    yield ""
+    yield "".join(molecule)
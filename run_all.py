@@ -0,0 +1,279 @@
+"""
+Run every day of every year and report where the time goes.
+
+Each day script is executed cell by cell (``# %%`` markers) in its own
+worker process, seeded with the `aoc_utils` globals just like the IPython
+startup file does. Wall time, CPU time and the answers sent through
+`aoc_answer_display` are recorded per cell, peak RSS per day, and the whole
+run is written to a JSON report.
+
+Examples
+--------
+    python run_all.py
+    python run_all.py 2015 --days "day0*" --jobs 4 --timeout 60
+    python run_all.py --output report.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import re
+import resource
+import signal
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent
+DAY_MODULE = re.compile(r"day_?\d+.*\.py")
+CELL_MARKER = re.compile(r"^# %%", re.MULTILINE)
+STDOUT_TAIL = 500
+
+
+def discover_days(
+    years: list[str] | None = None, pattern: str = "*", root: Path = ROOT
+) -> list[Path]:
+    """
+    Find the day scripts, e.g. ``2015/day01.py`` or ``2024/day_05.py``.
+
+    Parameters
+    ----------
+    years : list[str] | None, optional
+        Year directories to include, by default every year.
+    pattern : str, optional
+        Glob the file name has to match, by default "*".
+    root : Path, optional
+        Repository root, by default the directory of this file.
+
+    Returns
+    -------
+    list[Path]
+        The day scripts sorted by year and name.
+    """
+    return sorted(
+        path
+        for path in root.glob("[0-9][0-9][0-9][0-9]/*.py")
+        if DAY_MODULE.fullmatch(path.name)
+        and fnmatch(path.name, pattern)
+        and (not years or path.parent.name in years)
+    )
+
+
+def split_cells(source: str) -> list[tuple[int, str]]:
+    """
+    Split a script at its ``# %%`` markers into ``(first line, code)`` pairs.
+
+    The code keeps its original line numbers (by padding with newlines) so
+    tracebacks point at the right line of the file.
+    """
+    starts = [0] + [match.start() for match in CELL_MARKER.finditer(source)]
+    cells = []
+    for start, end in zip(starts, starts[1:] + [len(source)]):
+        code = source[start:end]
+        if code.strip():
+            line = source.count("\n", 0, start)
+            cells.append((line + 1, "\n" * line + code))
+    return cells
+
+
+def _raise_timeout(signum: int, frame: Any) -> None:
+    raise TimeoutError("cell exceeded the time limit")
+
+
+def run_day(path: str, timeout: float | None = None) -> dict[str, Any]:
+    """
+    Execute one day script in the current process and measure every cell.
+
+    Meant to run in a fresh worker: it changes directory to the year folder,
+    routes answers to the in-memory sink and reads this process' peak RSS.
+
+    Parameters
+    ----------
+    path : str
+        Path to the day script.
+    timeout : float | None, optional
+        Seconds a single cell may run before the rest of the day is skipped,
+        by default None.
+
+    Returns
+    -------
+    dict[str, Any]
+        Timings, answers and errors for the day and each of its cells.
+    """
+    script = Path(path).resolve()
+    os.environ["AOC_ANSWER_SINK"] = "memory"
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    os.chdir(script.parent)
+    sys.path[:0] = [str(script.parent), str(ROOT)]
+
+    import aoc_utils
+
+    namespace = {
+        name: value
+        for name, value in vars(aoc_utils).items()
+        if not name.startswith("__")
+    }
+    namespace.update(__name__="__main__", __file__=str(script))
+
+    def collected() -> list[tuple[str, Any]]:
+        # aoc_utils and the per-year copies (e.g. 2015/utilities.py) each
+        # keep their own list.
+        return [
+            answer
+            for module in list(sys.modules.values())
+            for answer in getattr(module, "aoc_collected_answers", None) or []
+        ]
+
+    if timeout:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+
+    cells = []
+    status = "ok"
+    day_wall, day_cpu = time.perf_counter(), time.process_time()
+    for line, code in split_cells(script.read_text(encoding="utf-8")):
+        seen = len(collected())
+        stdout = io.StringIO()
+        cell: dict[str, Any] = {"line": line}
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            if timeout:
+                signal.setitimer(signal.ITIMER_REAL, timeout)
+            with contextlib.redirect_stdout(stdout):
+                exec(compile(code, str(script), "exec"), namespace)
+        except TimeoutError as error:
+            cell["error"] = str(error)
+            status = "timeout"
+        except (Exception, SystemExit) as error:
+            cell["error"] = "".join(
+                traceback.format_exception_only(type(error), error)
+            ).strip()
+            status = "error"
+        finally:
+            if timeout:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+        cell["wall"] = time.perf_counter() - wall
+        cell["cpu"] = time.process_time() - cpu
+        cell["answers"] = [
+            {"source": source, "answer": answer}
+            for source, answer in collected()[seen:]
+        ]
+        cell["stdout"] = stdout.getvalue()[-STDOUT_TAIL:]
+        cells.append(cell)
+        if status == "timeout":
+            break
+
+    return {
+        "path": str(script.relative_to(ROOT)),
+        "year": script.parent.name,
+        "status": status,
+        "wall": time.perf_counter() - day_wall,
+        "cpu": time.process_time() - day_cpu,
+        # Kilobytes on Linux.
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "answers": [answer for cell in cells for answer in cell["answers"]],
+        "cells": cells,
+    }
+
+
+def _run_day_in_fresh_process(day: Path, timeout: float | None) -> dict[str, Any]:
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        return executor.submit(run_day, str(day), timeout).result()
+
+
+def run_all(
+    days: list[Path], jobs: int | None = None, timeout: float | None = None
+) -> dict[str, Any]:
+    """
+    Run `days` on a process pool, one fresh worker per day.
+
+    Returns
+    -------
+    dict[str, Any]
+        The report: run metadata and one `run_day` entry per day, in the
+        order of `days`.
+    """
+    started = datetime.now(timezone.utc)
+    wall = time.perf_counter()
+    results: dict[Path, dict[str, Any]] = {}
+
+    # Each thread hands its day to a fresh single-worker process pool, so RSS
+    # and module state don't leak between days. This is what
+    # max_tasks_per_child=1 does, but that needs Python 3.11.
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as executor:
+        futures = {
+            executor.submit(_run_day_in_fresh_process, day, timeout): day
+            for day in days
+        }
+        for future in as_completed(futures):
+            day = futures[future]
+            try:
+                results[day] = future.result()
+            except Exception as error:  # the worker itself died
+                results[day] = {
+                    "path": str(day.relative_to(ROOT)),
+                    "year": day.parent.name,
+                    "status": "crashed",
+                    "error": repr(error),
+                }
+            print(
+                f"{results[day]['status']:>8} "
+                f"{results[day].get('wall', float('nan')):8.2f}s  "
+                f"{results[day]['path']}",
+                file=sys.stderr,
+            )
+
+    return {
+        "started": started.isoformat(),
+        "wall": time.perf_counter() - wall,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "jobs": jobs or os.cpu_count(),
+        "days": [results[day] for day in days],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("years", nargs="*", help="years to run, by default all")
+    parser.add_argument("--days", default="*", help='file name glob, e.g. "day0*"')
+    parser.add_argument("--jobs", "-j", type=int, help="worker processes")
+    parser.add_argument("--timeout", type=float, help="seconds allowed per cell")
+    parser.add_argument(
+        "--output", "-o", default="run_all.json", help="where to write the report"
+    )
+    args = parser.parse_args(argv)
+
+    days = discover_days(args.years, args.days)
+    report = run_all(days, args.jobs, args.timeout)
+
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(
+            report,
+            file,
+            indent=2,
+            default=lambda value: (
+                value.item() if hasattr(value, "item") else str(value)
+            ),
+        )
+
+    failed = [day for day in report["days"] if day["status"] != "ok"]
+    print(
+        f"{len(days) - len(failed)}/{len(days)} days ok in {report['wall']:.2f}s, "
+        f"report written to {args.output}",
+        file=sys.stderr,
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())